@@ -0,0 +1,48 @@
+"""dietary_tags jsonb with gin index
+
+Revision ID: 3b9e1c7d2a64
+Revises: f5750bc5541f
+Create Date: 2026-10-15 14:27:41.902113
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3b9e1c7d2a64'
+down_revision: Union[str, Sequence[str], None] = 'f5750bc5541f'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.alter_column(
+        'recipes', 'dietary_tags',
+        type_=postgresql.JSONB(),
+        existing_type=sa.JSON(),
+        existing_nullable=True,
+        postgresql_using='dietary_tags::jsonb',
+    )
+    op.create_index(
+        'recipes_dietary_tags_gin', 'recipes', ['dietary_tags'],
+        unique=False,
+        postgresql_using='gin',
+        postgresql_ops={'dietary_tags': 'jsonb_path_ops'},
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('recipes_dietary_tags_gin', table_name='recipes', postgresql_using='gin')
+    op.alter_column(
+        'recipes', 'dietary_tags',
+        type_=sa.JSON(),
+        existing_type=postgresql.JSONB(),
+        existing_nullable=True,
+        postgresql_using='dietary_tags::json',
+    )
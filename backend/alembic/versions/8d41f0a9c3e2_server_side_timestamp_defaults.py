@@ -0,0 +1,48 @@
+"""server-side timestamp defaults
+
+Revision ID: 8d41f0a9c3e2
+Revises: 3b9e1c7d2a64
+Create Date: 2026-10-15 15:03:12.550871
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8d41f0a9c3e2'
+down_revision: Union[str, Sequence[str], None] = '3b9e1c7d2a64'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+TIMESTAMP_COLUMNS = [
+    ('recipes', 'created_at'),
+    ('recipes', 'updated_at'),
+    ('users', 'created_at'),
+    ('saved_recipes', 'saved_at'),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table, column in TIMESTAMP_COLUMNS:
+        op.alter_column(
+            table, column,
+            existing_type=sa.DateTime(),
+            existing_nullable=True,
+            server_default=sa.text("timezone('utc', now())"),
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table, column in TIMESTAMP_COLUMNS:
+        op.alter_column(
+            table, column,
+            existing_type=sa.DateTime(),
+            existing_nullable=True,
+            server_default=None,
+        )
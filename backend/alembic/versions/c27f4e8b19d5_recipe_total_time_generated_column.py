@@ -0,0 +1,35 @@
+"""recipe total_time_minutes generated column
+
+Revision ID: c27f4e8b19d5
+Revises: 8d41f0a9c3e2
+Create Date: 2026-10-15 16:12:38.204517
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c27f4e8b19d5'
+down_revision: Union[str, Sequence[str], None] = '8d41f0a9c3e2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('recipes', sa.Column(
+        'total_time_minutes',
+        sa.Integer(),
+        sa.Computed('COALESCE(prep_time_minutes, 0) + COALESCE(cook_time_minutes, 0)', persisted=True),
+        nullable=True,
+    ))
+    op.create_index(op.f('ix_recipes_total_time_minutes'), 'recipes', ['total_time_minutes'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_recipes_total_time_minutes'), table_name='recipes')
+    op.drop_column('recipes', 'total_time_minutes')
@@ -0,0 +1,32 @@
+"""add ingredient name_lower
+
+Revision ID: f5750bc5541f
+Revises: aca78b9db8a1
+Create Date: 2026-10-15 09:12:04.318265
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f5750bc5541f'
+down_revision: Union[str, Sequence[str], None] = 'aca78b9db8a1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('ingredients', sa.Column('name_lower', sa.String(length=100), nullable=True))
+    # Backfill existing rows in one statement
+    op.execute("UPDATE ingredients SET name_lower = lower(trim(name))")
+    op.create_index(op.f('ix_ingredients_name_lower'), 'ingredients', ['name_lower'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_ingredients_name_lower'), table_name='ingredients')
+    op.drop_column('ingredients', 'name_lower')
@@ -0,0 +1,156 @@
+"""
+🗃️ Cache Service - Content-Addressed Result Caching
+
+CONCEPT: Content-Addressed Caching
+
+Many of our AI calls are (mostly) pure functions of their input:
+- The same fridge photo always contains the same ingredients
+- The same recipe always has roughly the same nutrition
+
+So instead of paying seconds of latency (and real money) to call OpenAI
+again, we hash the input and remember the result:
+    key = sha256(image bytes) -> cached vision result
+
+Hits come back in microseconds instead of seconds.
+
+CONCEPT: Cache Stampede
+
+If ten requests for the same uncached image arrive at once, a naive cache
+lets all ten miss and call OpenAI ten times. We hold a per-key asyncio.Lock
+while computing, so the other nine wait and then read the cached result.
+
+This is an in-process cache: each worker keeps its own copy, and it is
+cleared when the server restarts.
+"""
+
+import asyncio
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable
+
+import cpu_pool
+
+
+_MISSING = object()
+
+
+def content_key(namespace: str, data: bytes | str) -> str:
+    """Build a cache key from a namespace tag and the SHA-256 of the content."""
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    return f"{namespace}:{hashlib.sha256(data).hexdigest()}"
+
+
+# Hashing is ~0.5ms per MB. Above this size we hash on the CPU pool
+# (hashlib releases the GIL on large buffers) so the event loop stays free.
+THREADED_HASH_MIN_BYTES = 1 << 20
+
+
+async def content_key_async(namespace: str, data: bytes | str) -> str:
+    """content_key for possibly large payloads (e.g. photos) - never blocks the loop."""
+    if len(data) < THREADED_HASH_MIN_BYTES:
+        return content_key(namespace, data)
+    return await cpu_pool.run(content_key, namespace, data)
+
+
+class TTLCache:
+    """
+    A small LRU cache whose entries expire after `ttl` seconds.
+
+    CONCEPT: OrderedDict as an LRU
+    OrderedDict remembers insertion order, and move_to_end() is O(1),
+    so the least recently used entry is always at the front.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 3600):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+        self._locks: dict[str, asyncio.Lock] = {}
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Return the cached value, or `default` if missing/expired."""
+        entry = self._data.get(key)
+        if entry is None:
+            return default
+
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._data[key]
+            return default
+
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: Any) -> None:
+        """Store a value, evicting the least recently used entry if full."""
+        self._data[key] = (time.monotonic() + self.ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop every cached entry."""
+        self._data.clear()
+
+    async def get_or_compute(
+        self,
+        key: str,
+        compute: Callable[[], Awaitable[Any]],
+        cache_if: Callable[[Any], bool] = lambda value: True,
+    ) -> Any:
+        """
+        Return the cached value for `key`, or await `compute()` and cache it.
+
+        Args:
+            key: Cache key (see content_key)
+            compute: Zero-argument coroutine factory producing the value
+            cache_if: Only cache results this returns True for (e.g. skip errors)
+        """
+        value = self.get(key, _MISSING)
+        if value is not _MISSING:
+            return value
+
+        lock = self._locks.setdefault(key, asyncio.Lock())
+        try:
+            async with lock:
+                # Another request may have filled the cache while we waited
+                value = self.get(key, _MISSING)
+                if value is not _MISSING:
+                    return value
+
+                value = await compute()
+                if cache_if(value):
+                    self.set(key, value)
+                return value
+        finally:
+            if not lock.locked():
+                self._locks.pop(key, None)
+
+
+class ThreadSafeTTLCache(TTLCache):
+    """
+    A TTLCache that worker threads may read, write and clear.
+
+    TTLCache assumes everything runs on the event loop: get() can delete an
+    expired key or move_to_end() one that another thread just evicted, and
+    the OrderedDict raises KeyError. Here get/set/clear take a lock.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 3600):
+        super().__init__(maxsize, ttl)
+        self._thread_lock = threading.Lock()
+
+    def get(self, key: str, default: Any = None) -> Any:
+        with self._thread_lock:
+            return super().get(key, default)
+
+    def set(self, key: str, value: Any) -> None:
+        with self._thread_lock:
+            super().set(key, value)
+
+    def clear(self) -> None:
+        with self._thread_lock:
+            super().clear()
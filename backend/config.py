@@ -54,6 +54,10 @@ class Settings:
     # OpenAI (Phase 3)
     # Set your API key via environment variable: export OPENAI_API_KEY="your-key"
     OPENAI_API_KEY: str | None = os.getenv("OPENAI_API_KEY")
+    
+    # Speech-to-text model: "whisper-1", or e.g. "gpt-4o-mini-transcribe"
+    # (often faster) once it's been tried against your users' audio
+    TRANSCRIBE_MODEL: str = os.getenv("TRANSCRIBE_MODEL", "whisper-1")
 
 
 @lru_cache()
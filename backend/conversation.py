@@ -0,0 +1,75 @@
+"""
+🧵 Conversation History - Keep Each Turn's Prompt Bounded
+
+CONCEPT: Token Budget
+
+Every chat turn re-sends the conversation so far, so the prompt (and the
+time the model spends reading it) grows with each turn. "Last 10 messages"
+doesn't bound that - ten long messages can be thousands of tokens.
+
+Instead we keep the most recent messages that fit in a fixed token budget.
+Tokens are counted with tiktoken when it's installed, otherwise estimated
+at ~4 characters per token.
+"""
+
+from functools import lru_cache
+
+try:
+    import tiktoken
+except ImportError:
+    tiktoken = None
+
+
+# History tokens sent with each turn (system prompt and new message not included)
+HISTORY_TOKEN_BUDGET = 1500
+
+# Role, separators etc. that every chat message costs on top of its content
+TOKENS_PER_MESSAGE = 4
+
+
+@lru_cache(maxsize=1)
+def _encoding():
+    """The gpt-4o tokenizer, or None if it's unavailable."""
+    if tiktoken is None:
+        return None
+    try:
+        return tiktoken.get_encoding("o200k_base")
+    except Exception as e:  # The BPE file is downloaded on first use
+        print(f"[Conversation] tiktoken unavailable, estimating tokens: {e}")
+        return None
+
+
+def warm_up() -> None:
+    """
+    Load the tokenizer before serving traffic.
+    
+    The first load may download the BPE file - a blocking network call that
+    must not happen inside trim_history on the event loop. Run this at
+    startup (in a thread); later calls hit the lru_cache.
+    """
+    _encoding()
+
+
+def count_tokens(text: str) -> int:
+    """Number of tokens in `text` (estimated if tiktoken isn't available)."""
+    encoding = _encoding()
+    if encoding is None:
+        return len(text) // 4
+    return len(encoding.encode(text))
+
+
+def trim_history(history: list[dict], budget: int = HISTORY_TOKEN_BUDGET) -> list[dict]:
+    """
+    Return the most recent messages whose tokens fit in `budget`.
+    
+    Walks backwards from the newest message and stops at the first one
+    that doesn't fit, so the kept history is always contiguous.
+    """
+    used = 0
+    start = len(history)
+    for index in range(len(history) - 1, -1, -1):
+        used += count_tokens(history[index].get("content") or "") + TOKENS_PER_MESSAGE
+        if used > budget:
+            break
+        start = index
+    return history[start:]
@@ -0,0 +1,51 @@
+"""
+⚙️ CPU Pool - Dedicated Threads for CPU-Bound Work
+
+CONCEPT: Keep CPU Work Off the Event Loop
+
+Hashing photos, decoding base64 and resizing frames with Pillow take
+milliseconds of pure CPU each. Run directly in an async handler, that time
+freezes the event loop and every other request waits behind it.
+
+asyncio.to_thread moves work to the loop's default executor - but that pool
+is shared with blocking I/O (database lookups, recipe indexing, ...), so a
+burst of camera frames can queue behind a slow indexing job and vice versa.
+CPU-bound helpers go through this pool instead:
+
+    image_base64 = await cpu_pool.run(prepare_frame, image)
+
+Threads (rather than processes) are enough here: hashlib, base64 and
+Pillow's resize/encode release the GIL on large buffers, and handing
+megabyte images to another process would cost a pickle copy each way.
+The pool is bounded by the number of cores - more threads than that just
+contend for the same CPUs.
+"""
+
+import asyncio
+import functools
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable
+
+# pybase64 is a SIMD-accelerated drop-in for the base64 module (optional).
+# Imported here once - every module that encodes or decodes on this pool
+# uses it via `from cpu_pool import base64`.
+try:
+    import pybase64 as base64
+except ImportError:
+    import base64
+
+CPU_WORKERS = min(8, os.cpu_count() or 1)
+
+_executor = ThreadPoolExecutor(max_workers=CPU_WORKERS, thread_name_prefix="cpu")
+
+
+async def run(func: Callable[..., Any], *args, **kwargs) -> Any:
+    """Run a CPU-bound function on the CPU pool and await its result."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_executor, functools.partial(func, *args, **kwargs))
+
+
+def shutdown() -> None:
+    """Stop the pool's threads (call once, on shutdown)."""
+    _executor.shutdown(wait=False, cancel_futures=True)
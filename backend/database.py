@@ -16,7 +16,10 @@ Benefits:
 This file sets up the database connection and session management.
 """
 
+from typing import AsyncIterator
+
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker, DeclarativeBase
 from config import settings
 
@@ -52,6 +55,38 @@ SessionLocal = sessionmaker(
 )
 
 
+# =============================================================================
+# CONCEPT: Async Engine & Sessions
+# =============================================================================
+# Our API endpoints are `async def`. A regular (sync) session blocks the
+# whole event loop while it waits on PostgreSQL, so every other request
+# waits too. An AsyncSession awaits the database instead, letting many
+# requests' queries be in flight at once.
+#
+# The API uses the async engine; scripts (seeding, indexing) and background
+# work keep using the sync SessionLocal above.
+
+def _async_database_url(url: str) -> str:
+    """Point a postgresql:// URL at the asyncpg driver."""
+    scheme, sep, rest = url.partition("://")
+    if scheme in ("postgresql", "postgres", "postgresql+psycopg2"):
+        return f"postgresql+asyncpg{sep}{rest}"
+    return url
+
+
+async_engine = create_async_engine(
+    _async_database_url(settings.DATABASE_URL),
+    echo=True,
+    pool_pre_ping=True,
+)
+
+AsyncSessionLocal = async_sessionmaker(
+    async_engine,
+    autoflush=False,
+    expire_on_commit=False,  # Objects stay usable after commit (no lazy reloads)
+)
+
+
 # =============================================================================
 # CONCEPT: Base Class for Models
 # =============================================================================
@@ -76,18 +111,15 @@ class Base(DeclarativeBase):
 # 2. Gives it to the request handler
 # 3. Cleans up after the request (even if there's an error)
 
-def get_db():
+async def get_db() -> AsyncIterator[AsyncSession]:
     """
-    Dependency that provides a database session.
+    Dependency that provides an async database session.
     
     Usage in FastAPI:
         @app.get("/items")
-        def get_items(db: Session = Depends(get_db)):
-            return db.query(Item).all()
+        async def get_items(db: AsyncSession = Depends(get_db)):
+            return (await db.scalars(select(Item))).all()
     """
-    db = SessionLocal()
-    try:
+    async with AsyncSessionLocal() as db:
         yield db
-    finally:
-        db.close()
 
@@ -0,0 +1,140 @@
+"""
+🎞️ Live Cook Batcher - Dynamic Micro-Batching for Frame Analysis
+
+CONCEPT: Dynamic Batching
+
+During live cooking every user's camera sends a frame about once a second,
+and each frame is an independent GPT-4 Vision call. With many users cooking
+at once, we pay one full network round trip per frame.
+
+Instead, frames that arrive within a short window (25ms) are collected and
+sent to OpenAI together as a single multi-image request:
+
+    user A frame ─┐
+    user B frame ─┼─> [wait ≤25ms] ─> one vision call ─> split results
+    user C frame ─┘
+
+Each caller awaits an asyncio.Future that is resolved with its own slice of
+the batched response. A frame that arrives alone is analyzed on its own,
+exactly as before, and if a batched call fails every frame in it is retried
+individually - batching can only make things faster, never less reliable.
+"""
+
+import asyncio
+
+import live_cook_service
+
+
+# Most frames we'll put into one vision request
+MAX_BATCH = 8
+
+# How long to wait for more frames after the first one arrives
+BATCH_WINDOW_SECONDS = 0.025
+
+
+class LiveCookBatcher:
+    """
+    Coalesces concurrent analyze_cooking_frame calls into batched vision calls.
+
+    Call start() once the event loop is running (FastAPI startup); until
+    then, analyze() simply analyzes each frame on its own.
+    """
+
+    def __init__(self, max_batch: int = MAX_BATCH, window: float = BATCH_WINDOW_SECONDS):
+        self.max_batch = max_batch
+        self.window = window
+        self._queue: asyncio.Queue | None = None
+        self._worker: asyncio.Task | None = None
+        # Strong references so in-flight dispatches aren't garbage collected
+        self._tasks: set[asyncio.Task] = set()
+
+    def start(self) -> None:
+        """Start the background worker that drains the queue."""
+        if self._worker is None:
+            self._queue = asyncio.Queue()
+            self._worker = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the worker, finishing in-flight batches and analyzing queued frames individually."""
+        if self._worker is None:
+            return
+        self._worker.cancel()
+        try:
+            await self._worker
+        except asyncio.CancelledError:
+            pass
+        self._worker = None
+
+        leftover = []
+        while not self._queue.empty():
+            frame, future = self._queue.get_nowait()
+            leftover.append(self._analyze_one(frame, future))
+        await asyncio.gather(*self._tasks, *leftover)
+
+    async def analyze(self, **frame) -> dict:
+        """
+        Analyze one frame, possibly batched with frames from other requests.
+
+        Takes the same keyword arguments as live_cook_service.analyze_cooking_frame
+        and returns the same result dict.
+        """
+        if self._worker is None:
+            return await live_cook_service.analyze_cooking_frame(**frame)
+
+        future = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((frame, future))
+        return await future
+
+    async def _run(self) -> None:
+        """Collect frames into batches and dispatch them."""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.window
+
+            while len(batch) < self.max_batch:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+
+            # Don't wait for OpenAI here - keep collecting the next batch
+            task = asyncio.create_task(self._dispatch(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _dispatch(self, batch: list[tuple[dict, asyncio.Future]]) -> None:
+        """Analyze a batch and resolve each caller's future."""
+        if len(batch) == 1:
+            await self._analyze_one(*batch[0])
+            return
+
+        try:
+            results = await live_cook_service.analyze_cooking_frames(
+                [frame for frame, _ in batch]
+            )
+        except Exception as e:
+            print(f"[LiveCook] Batch of {len(batch)} failed, analyzing individually: {e}")
+            await asyncio.gather(*(self._analyze_one(frame, future) for frame, future in batch))
+            return
+
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
+
+    @staticmethod
+    async def _analyze_one(frame: dict, future: asyncio.Future) -> None:
+        """Single-frame path (also the fallback for failed batches)."""
+        try:
+            result = await live_cook_service.analyze_cooking_frame(**frame)
+        except Exception as e:
+            result = {"success": False, "error": str(e)}
+        if not future.done():
+            future.set_result(result)
+
+
+# Shared batcher used by the /api/live-cook/analyze endpoint
+batcher = LiveCookBatcher()
@@ -10,10 +10,28 @@ This service handles:
 
 import json
 import base64
-from openai import OpenAI
-from config import settings
+from openai_client import async_client
+import vision_service
 
-client = OpenAI(api_key=settings.OPENAI_API_KEY)
+
+# CONCEPT: Right-Sizing Frames
+# Browsers capture 1280x720 or more, but in "low" detail mode OpenAI looks
+# at a 512px version anyway. Shrinking frames to 768px JPEG q70 before
+# sending cuts upload size several times over without losing anything
+# the model would have seen.
+FRAME_MAX_EDGE = 768
+FRAME_JPEG_QUALITY = 70
+
+
+def prepare_frame(image: bytes | str) -> str:
+    """
+    Turn a camera frame (raw bytes or base64) into a right-sized base64 JPEG.
+    
+    CPU-bound - call it via cpu_pool.run.
+    """
+    if isinstance(image, bytes):
+        return vision_service.encode_image(image, FRAME_MAX_EDGE, FRAME_JPEG_QUALITY)
+    return vision_service.shrink_base64_image(image, FRAME_MAX_EDGE, FRAME_JPEG_QUALITY)
 
 
 # =============================================================================
@@ -73,6 +91,45 @@ Respond in JSON format:
 Be specific and actionable. They're cooking right now and need clear, immediate guidance.
 """
 
+BATCH_ANALYSIS_SYSTEM_PROMPT = """You are an expert AI cooking coach watching several home cooks in real-time through their cameras.
+
+You will receive {count} camera frames. Each frame comes from a DIFFERENT kitchen and has its own
+recipe and step. Analyze every frame independently - never mix up details between frames.
+
+IMPORTANT GUIDELINES:
+- Be concise - they're cooking and can't read long messages
+- Be specific - "stir for 30 more seconds" not "stir a bit more"
+- Be proactive - warn about issues BEFORE they happen
+- Focus on what you actually SEE in each image
+
+Respond in JSON format, with exactly one entry per frame, in the same order:
+{{
+    "frames": [
+        {{
+            "frame": 1,
+            "detected_items": ["list", "of", "visible", "items"],
+            "current_action": "what they appear to be doing",
+            "guidance": "Brief, specific guidance for right now (1-2 sentences max)",
+            "speak": true/false,
+            "warning": "Only if there's something concerning, otherwise null",
+            "tip": "Optional quick tip, otherwise null",
+            "step_complete_suggestion": true/false,
+            "next_step_preview": "Brief preview of next step if step seems complete, otherwise null",
+            "timing_advice": "Any timing advice like 'flip in 30 seconds' or null",
+            "ingredient_amounts": "If you can see them measuring, advise on amounts, otherwise null"
+        }}
+    ]
+}}
+"""
+
+# Per-frame context that precedes each image in a batched analysis
+LIVE_ANALYSIS_CONTEXT = """Frame {frame}:
+Recipe: {recipe_name}
+Current Step {step_num}: {current_instruction}
+Previously: {previous_context}
+Previously detected ingredients: {detected_ingredients}"""
+
+
 VOICE_COMMAND_SYSTEM_PROMPT = """You are an AI cooking assistant responding to voice commands while someone cooks.
 
 Context:
@@ -121,12 +178,8 @@ async def analyze_cooking_frame(
     """
     
     # Build context string
-    prev_context_str = ""
-    if previous_context:
-        if previous_context.get("detectedIngredients"):
-            prev_context_str = f"Previously saw: {', '.join(previous_context['detectedIngredients'][:5])}"
-    
-    detected_str = ", ".join(detected_ingredients[:10]) if detected_ingredients else "none yet"
+    prev_context_str = _previous_context_str(previous_context)
+    detected_str = _detected_str(detected_ingredients)
     
     prompt = LIVE_ANALYSIS_PROMPT.format(
         recipe_name=recipe_name,
@@ -136,7 +189,7 @@ async def analyze_cooking_frame(
     )
     
     try:
-        response = client.chat.completions.create(
+        response = await async_client.chat.completions.create(
             model="gpt-4o-mini",  # Fast model for real-time
             messages=[
                 {
@@ -184,6 +237,79 @@ async def analyze_cooking_frame(
         }
 
 
+def _previous_context_str(previous_context: dict | None) -> str:
+    """Summarize what earlier frames saw."""
+    if previous_context and previous_context.get("detectedIngredients"):
+        return f"Previously saw: {', '.join(previous_context['detectedIngredients'][:5])}"
+    return ""
+
+
+def _detected_str(detected_ingredients: list | None) -> str:
+    return ", ".join(detected_ingredients[:10]) if detected_ingredients else "none yet"
+
+
+async def analyze_cooking_frames(frames: list[dict]) -> list[dict]:
+    """
+    Analyze several camera frames (from different users) in ONE vision call.
+    
+    CONCEPT: Micro-batching
+    Each OpenAI call pays a fixed round trip; under live-camera load many
+    frames arrive at nearly the same moment. Sending them together means
+    one round trip instead of N. See live_cook_batcher.py.
+    
+    Args:
+        frames: analyze_cooking_frame keyword arguments, one dict per frame
+    
+    Returns:
+        One result dict per frame, in order (same shape as analyze_cooking_frame)
+    
+    Raises:
+        ValueError: If the response doesn't contain one result per frame,
+            numbered in order
+    """
+    content = []
+    for number, frame in enumerate(frames, start=1):
+        context = LIVE_ANALYSIS_CONTEXT.format(
+            frame=number,
+            recipe_name=frame.get("recipe_name", "Unknown Recipe"),
+            step_num=frame.get("current_step", 1),
+            current_instruction=frame.get("current_instruction", ""),
+            previous_context=_previous_context_str(frame.get("previous_context")) or "nothing yet",
+            detected_ingredients=_detected_str(frame.get("detected_ingredients")),
+        )
+        content.append({"type": "text", "text": context})
+        content.append({
+            "type": "image_url",
+            "image_url": {
+                "url": f"data:image/jpeg;base64,{frame['image_base64']}",
+                "detail": "low"  # Low detail for speed
+            }
+        })
+    
+    response = await async_client.chat.completions.create(
+        model="gpt-4o-mini",
+        messages=[
+            {"role": "system", "content": BATCH_ANALYSIS_SYSTEM_PROMPT.format(count=len(frames))},
+            {"role": "user", "content": content},
+        ],
+        response_format={"type": "json_object"},
+        max_tokens=300 * len(frames),  # Same budget per frame as a single analysis
+        temperature=0.3,
+    )
+    
+    results = json.loads(response.choices[0].message.content).get("frames", [])
+    if len(results) != len(frames):
+        raise ValueError(f"Expected {len(frames)} frame results, got {len(results)}")
+    
+    # Results are handed back by position, so a reordered reply would send
+    # one cook's guidance to another - the caller falls back to single frames
+    for number, result in enumerate(results, start=1):
+        if str(result.pop("frame", "")) != str(number):
+            raise ValueError(f"Frame results out of order at position {number}")
+        result["success"] = True
+    return results
+
+
 async def process_voice_command(
     command: str,
     recipe_name: str,
@@ -206,7 +332,7 @@ async def process_voice_command(
             context_info += f"Timing note: {last_analysis['timing_advice']}. "
     
     try:
-        response = client.chat.completions.create(
+        response = await async_client.chat.completions.create(
             model="gpt-4o-mini",
             messages=[
                 {
@@ -257,7 +383,7 @@ async def get_ingredient_guidance(
                 break
     
     try:
-        response = client.chat.completions.create(
+        response = await async_client.chat.completions.create(
             model="gpt-4o-mini",
             messages=[
                 {
@@ -299,7 +425,7 @@ async def get_timing_guidance(
         context += f"\nWhat I can see: {visual_context}"
     
     try:
-        response = client.chat.completions.create(
+        response = await async_client.chat.completions.create(
             model="gpt-4o-mini",
             messages=[
                 {
@@ -20,15 +20,23 @@ CONCEPT: Prompt Engineering
 The key to getting good results from an LLM is crafting good prompts.
 We'll use a "system prompt" to set the AI's persona and a "user prompt"
 to describe the specific task.
+
+CONCEPT: Streaming
+
+A full GPT-4 answer takes seconds, but the first tokens arrive in a few
+hundred milliseconds. The *_stream functions yield text as it is generated
+so the frontend can start rendering straight away.
 """
 
 import json
-from openai import OpenAI
-from config import settings
+from typing import AsyncIterator
 
+from conversation import trim_history
+from openai_client import async_client
 
-# Initialize OpenAI client
-client = OpenAI(api_key=settings.OPENAI_API_KEY)
+
+# Every call uses the shared async client (see openai_client.py) - a
+# multi-second completion must not block the event loop for other requests
 
 
 # =============================================================================
@@ -119,27 +127,12 @@ async def get_ai_recipe_suggestions(
     We use response_format to get structured JSON output.
     """
     
-    # Format existing recipes for context
-    recipe_context = "\n".join([
-        f"- {r.get('name', 'Unknown')}: {r.get('description', '')[:100]}"
-        for r in existing_recipes[:5]  # Limit to avoid token overflow
-    ]) if existing_recipes else "None provided"
-    
-    # Build the user prompt
-    user_prompt = RECIPE_SUGGESTION_PROMPT.format(
-        ingredients=", ".join(ingredients) if ingredients else "None specified",
-        restrictions=", ".join(dietary_restrictions) if dietary_restrictions else "None",
-        cuisine=cuisine_preference or "Any",
-        existing_recipes=recipe_context
-    )
-    
     try:
-        response = client.chat.completions.create(
+        response = await async_client.chat.completions.create(
             model="gpt-4o-mini",  # Cost-effective and fast
-            messages=[
-                {"role": "system", "content": CHEF_SYSTEM_PROMPT},
-                {"role": "user", "content": user_prompt}
-            ],
+            messages=_suggestion_messages(
+                ingredients, dietary_restrictions, cuisine_preference, existing_recipes
+            ),
             response_format={"type": "json_object"},
             temperature=0.7,  # Some creativity, but not too random
             max_tokens=1500,
@@ -170,6 +163,34 @@ async def get_ai_recipe_suggestions(
         }
 
 
+def _suggestion_messages(
+    ingredients: list[str],
+    dietary_restrictions: list[str],
+    cuisine_preference: str | None,
+    existing_recipes: list[dict]
+) -> list[dict]:
+    """Build the chat messages for a recipe suggestion request."""
+    
+    # Format existing recipes for context
+    recipe_context = "\n".join([
+        f"- {r.get('name', 'Unknown')}: {r.get('description', '')[:100]}"
+        for r in existing_recipes[:5]  # Limit to avoid token overflow
+    ]) if existing_recipes else "None provided"
+    
+    # Build the user prompt
+    user_prompt = RECIPE_SUGGESTION_PROMPT.format(
+        ingredients=", ".join(ingredients) if ingredients else "None specified",
+        restrictions=", ".join(dietary_restrictions) if dietary_restrictions else "None",
+        cuisine=cuisine_preference or "Any",
+        existing_recipes=recipe_context
+    )
+    
+    return [
+        {"role": "system", "content": CHEF_SYSTEM_PROMPT},
+        {"role": "user", "content": user_prompt}
+    ]
+
+
 async def get_recipe_details(
     recipe_name: str,
     ingredients: list[str],
@@ -207,7 +228,7 @@ Format as JSON:
 """
 
     try:
-        response = client.chat.completions.create(
+        response = await async_client.chat.completions.create(
             model="gpt-4o-mini",
             messages=[
                 {"role": "system", "content": CHEF_SYSTEM_PROMPT},
@@ -240,19 +261,10 @@ async def chat_with_chef(
     - Answer follow-up questions
     """
     
-    messages = [{"role": "system", "content": CHEF_SYSTEM_PROMPT}]
-    
-    # Add conversation history
-    for msg in conversation_history[-10:]:  # Keep last 10 messages
-        messages.append(msg)
-    
-    # Add current message
-    messages.append({"role": "user", "content": message})
-    
     try:
-        response = client.chat.completions.create(
+        response = await async_client.chat.completions.create(
             model="gpt-4o-mini",
-            messages=messages,
+            messages=_chef_chat_messages(message, conversation_history),
             temperature=0.7,
             max_tokens=1000,
         )
@@ -270,6 +282,18 @@ async def chat_with_chef(
         return {"success": False, "error": str(e)}
 
 
+def _chef_chat_messages(message: str, conversation_history: list[dict]) -> list[dict]:
+    """Build the chat messages for a Chef Pantry conversation turn."""
+    messages = [{"role": "system", "content": CHEF_SYSTEM_PROMPT}]
+    
+    # Add as much recent conversation history as fits the token budget
+    messages.extend(trim_history(conversation_history))
+    
+    # Add current message
+    messages.append({"role": "user", "content": message})
+    return messages
+
+
 # =============================================================================
 # Nutrition Estimation
 # =============================================================================
@@ -285,6 +309,24 @@ async def estimate_nutrition(
     Returns estimated macros per serving.
     """
     
+    try:
+        response = await async_client.chat.completions.create(
+            model="gpt-4o-mini",
+            messages=_nutrition_messages(recipe_name, ingredients, servings),
+            response_format={"type": "json_object"},
+            temperature=0.3,  # Lower temperature for more consistent estimates
+            max_tokens=500,
+        )
+        
+        result = json.loads(response.choices[0].message.content)
+        return {"success": True, "data": result}
+        
+    except Exception as e:
+        return {"success": False, "error": str(e)}
+
+
+def _nutrition_messages(recipe_name: str, ingredients: list[str], servings: int) -> list[dict]:
+    """Build the chat messages for a nutrition estimate."""
     ingredients_str = ", ".join(ingredients) if ingredients else "not specified"
     
     prompt = f"""Estimate the nutritional information per serving for this recipe:
@@ -311,23 +353,71 @@ Format as JSON:
 }}
 """
 
-    try:
-        response = client.chat.completions.create(
-            model="gpt-4o-mini",
-            messages=[
-                {"role": "system", "content": "You are a nutrition expert. Provide reasonable estimates for recipe nutrition based on typical ingredient amounts. Always include a disclaimer that these are estimates."},
-                {"role": "user", "content": prompt}
-            ],
-            response_format={"type": "json_object"},
-            temperature=0.3,  # Lower temperature for more consistent estimates
-            max_tokens=500,
-        )
-        
-        result = json.loads(response.choices[0].message.content)
-        return {"success": True, "data": result}
-        
-    except Exception as e:
-        return {"success": False, "error": str(e)}
+    return [
+        {"role": "system", "content": "You are a nutrition expert. Provide reasonable estimates for recipe nutrition based on typical ingredient amounts. Always include a disclaimer that these are estimates."},
+        {"role": "user", "content": prompt}
+    ]
+
+
+# =============================================================================
+# Streaming Variants
+# =============================================================================
+# Same prompts and settings as above, but tokens are yielded as they arrive.
+# JSON responses are only valid once complete - the caller accumulates the
+# text and parses it at the end.
+
+async def _stream_completion(**kwargs) -> AsyncIterator[str]:
+    """Yield the text deltas of a streamed chat completion."""
+    stream = await async_client.chat.completions.create(stream=True, **kwargs)
+    async for chunk in stream:
+        if chunk.choices and chunk.choices[0].delta.content:
+            yield chunk.choices[0].delta.content
+
+
+def chat_with_chef_stream(
+    message: str,
+    conversation_history: list[dict] = []
+) -> AsyncIterator[str]:
+    """Stream a Chef Pantry reply token by token."""
+    return _stream_completion(
+        model="gpt-4o-mini",
+        messages=_chef_chat_messages(message, conversation_history),
+        temperature=0.7,
+        max_tokens=1000,
+    )
+
+
+def get_ai_recipe_suggestions_stream(
+    ingredients: list[str],
+    dietary_restrictions: list[str] = [],
+    cuisine_preference: str | None = None,
+    existing_recipes: list[dict] = []
+) -> AsyncIterator[str]:
+    """Stream the raw JSON text of AI recipe suggestions."""
+    return _stream_completion(
+        model="gpt-4o-mini",
+        messages=_suggestion_messages(
+            ingredients, dietary_restrictions, cuisine_preference, existing_recipes
+        ),
+        response_format={"type": "json_object"},
+        temperature=0.7,
+        max_tokens=1500,
+    )
+
+
+def estimate_nutrition_stream(
+    recipe_name: str,
+    ingredients: list[str],
+    servings: int = 4
+) -> AsyncIterator[str]:
+    """Stream the raw JSON text of a nutrition estimate."""
+    return _stream_completion(
+        model="gpt-4o-mini",
+        messages=_nutrition_messages(recipe_name, ingredients, servings),
+        response_format={"type": "json_object"},
+        temperature=0.3,
+        max_tokens=500,
+    )
 
 
 # =============================================================================
@@ -345,7 +435,7 @@ def estimate_tokens(text: str) -> int:
 async def test_connection() -> dict:
     """Test that the OpenAI API key is working."""
     try:
-        response = client.chat.completions.create(
+        response = await async_client.chat.completions.create(
             model="gpt-4o-mini",
             messages=[{"role": "user", "content": "Say 'Hello, Chef!' in a friendly way."}],
             max_tokens=50,
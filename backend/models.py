@@ -13,15 +13,23 @@ SQLAlchemy uses "declarative" style:
 - SQLAlchemy generates the SQL to create tables
 """
 
-from datetime import datetime
 from sqlalchemy import (
     Column, Integer, String, Text, Boolean, DateTime, 
-    ForeignKey, Float, JSON, Table
+    ForeignKey, Float, JSON, Table, Index, Computed, event, func
 )
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import relationship
 from database import Base
 
 
+# CONCEPT: Server-Side Defaults
+# Timestamps are filled in by PostgreSQL itself rather than by a Python
+# callback per row, so bulk inserts don't call back into Python and every
+# row gets the database's clock. Columns are "timestamp without time zone"
+# holding UTC, so we ask for now() in UTC - the same values utcnow() gave.
+utc_now = func.timezone("utc", func.now())
+
+
 # =============================================================================
 # CONCEPT: Many-to-Many Relationships
 # =============================================================================
@@ -60,6 +68,12 @@ class Ingredient(Base):
     # The ingredient name (required, must be unique)
     name = Column(String(100), nullable=False, unique=True, index=True)
     
+    # CONCEPT: Denormalization
+    # A lowercased copy of the name, filled in automatically on write.
+    # Matching is case-insensitive, so we pay for .lower() once per insert
+    # instead of once per ingredient on every search request.
+    name_lower = Column(String(100), index=True)
+    
     # Category for organization (protein, vegetable, dairy, etc.)
     category = Column(String(50))
     
@@ -74,6 +88,23 @@ class Ingredient(Base):
         return f"<Ingredient(name='{self.name}')>"
 
 
+@event.listens_for(Ingredient, "before_insert")
+@event.listens_for(Ingredient, "before_update")
+def _set_ingredient_name_lower(mapper, connection, target):
+    """Keep name_lower in sync with name."""
+    target.name_lower = normalize_ingredient_name(target.name) if target.name else None
+
+
+def normalize_ingredient_name(name: str) -> str:
+    """The form ingredient names are matched in: lowercased and trimmed."""
+    return name.lower().strip()
+
+
+def normalize_ingredient_names(names: list[str]) -> list[str]:
+    """Normalize a batch of user-typed ingredient names, dropping blanks."""
+    return [name.strip().lower() for name in names if name.strip()]
+
+
 # =============================================================================
 # Recipe Model
 # =============================================================================
@@ -102,12 +133,23 @@ class Recipe(Base):
     # Cooking details
     prep_time_minutes = Column(Integer)  # Time to prepare
     cook_time_minutes = Column(Integer)  # Time to cook
+    
+    # CONCEPT: Generated Column
+    # prep + cook, computed by PostgreSQL whenever the row is written.
+    # Being a real column, it can be sorted on and indexed ("quick meals
+    # under 30 minutes" becomes an index range scan).
+    total_time_minutes = Column(
+        Integer,
+        Computed("COALESCE(prep_time_minutes, 0) + COALESCE(cook_time_minutes, 0)", persisted=True),
+        index=True,
+    )
     servings = Column(Integer)
     difficulty = Column(String(20))  # Easy, Medium, Hard
     
     # Cuisine and dietary info
     cuisine = Column(String(50), index=True)  # Italian, Mexican, etc.
-    dietary_tags = Column(JSON)  # ["vegetarian", "gluten-free"]
+    # JSONB (not JSON) so Postgres can index it - see __table_args__
+    dietary_tags = Column(JSONB)  # ["vegetarian", "gluten-free"]
     
     # The actual recipe content
     instructions = Column(Text)  # Step-by-step instructions
@@ -115,8 +157,8 @@ class Recipe(Base):
     # Metadata
     image_url = Column(String(500))
     source_url = Column(String(500))  # Original recipe source
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime, server_default=utc_now)
+    updated_at = Column(DateTime, server_default=utc_now, onupdate=utc_now)
     
     # CONCEPT: Relationships
     # This creates a virtual attribute that loads related ingredients
@@ -127,20 +169,35 @@ class Recipe(Base):
         back_populates="recipes"
     )
     
+    # CONCEPT: GIN Index
+    # A normal (btree) index can't look inside a JSON array. A GIN index
+    # indexes every element, so "dietary_tags @> '["vegan"]'" (what
+    # .contains() generates) becomes an index lookup instead of a scan of
+    # every recipe. jsonb_path_ops is smaller and faster, and containment is
+    # the only operator we use on this column.
+    __table_args__ = (
+        Index(
+            "recipes_dietary_tags_gin",
+            "dietary_tags",
+            postgresql_using="gin",
+            postgresql_ops={"dietary_tags": "jsonb_path_ops"},
+        ),
+    )
+    
+    # Read the database-generated timestamps back in the INSERT/UPDATE
+    # itself (RETURNING) rather than with a second SELECT later
+    __mapper_args__ = {"eager_defaults": True}
+    
     def __repr__(self):
         return f"<Recipe(name='{self.name}')>"
     
-    @property
-    def total_time_minutes(self) -> int:
-        """Total cooking time (prep + cook)."""
-        prep = self.prep_time_minutes or 0
-        cook = self.cook_time_minutes or 0
-        return prep + cook
-    
     @property
     def total_time_display(self) -> str:
         """Human-readable total time."""
         total = self.total_time_minutes
+        if total is None:
+            # Not written to the database yet
+            total = (self.prep_time_minutes or 0) + (self.cook_time_minutes or 0)
         if total >= 60:
             hours = total // 60
             mins = total % 60
@@ -173,7 +230,7 @@ class User(Base):
     
     # Profile
     display_name = Column(String(100))
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, server_default=utc_now)
     
     # Relationships
     preferences = relationship("UserPreference", back_populates="user", uselist=False)
@@ -246,7 +303,7 @@ class SavedRecipe(Base):
     # User's personal additions
     rating = Column(Integer)  # 1-5 stars
     notes = Column(Text)  # Personal notes about the recipe
-    saved_at = Column(DateTime, default=datetime.utcnow)
+    saved_at = Column(DateTime, server_default=utc_now)
     
     def __repr__(self):
         return f"<SavedRecipe(user_id={self.user_id}, recipe_id={self.recipe_id})>"
@@ -0,0 +1,52 @@
+"""
+🔌 OpenAI Client - One Shared Connection Pool
+
+CONCEPT: Connection Reuse
+
+Every call to OpenAI is an HTTPS request. A brand-new connection pays for a
+TCP handshake, a TLS handshake and TCP slow-start before the first byte of
+our request is even sent - easily 100-300ms on top of the model's own time.
+
+So every async OpenAI call in the app goes through ONE httpx.AsyncClient:
+- Keep-alive: finished connections go back into a pool and are reused
+- HTTP/2: many concurrent requests are multiplexed over one connection,
+  so a burst of live-cooking frames doesn't open a burst of sockets
+
+HTTP/2 needs the `h2` package (httpx[http2]); without it we stay on
+HTTP/1.1 keep-alive, which still skips the handshakes.
+
+The first connection is opened at startup (warm_up) so the first user
+request doesn't pay for the handshakes, and the client is closed on server
+shutdown (see main.py).
+"""
+
+import httpx
+from openai import AsyncOpenAI
+
+from config import settings
+
+try:
+    import h2  # noqa: F401 - only needed so httpx can speak HTTP/2
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+
+http_client = httpx.AsyncClient(
+    http2=HTTP2_AVAILABLE,
+    # Vision and TTS calls can legitimately take a while; connecting shouldn't
+    timeout=httpx.Timeout(60.0, connect=10.0),
+    limits=httpx.Limits(max_keepalive_connections=100, max_connections=200),
+)
+
+async_client = AsyncOpenAI(api_key=settings.OPENAI_API_KEY, http_client=http_client)
+
+
+async def warm_up() -> None:
+    """Open a pooled connection to OpenAI with one cheap request."""
+    await async_client.models.retrieve("gpt-4o-mini")
+
+
+async def aclose() -> None:
+    """Close pooled connections (call once, on shutdown)."""
+    await http_client.aclose()
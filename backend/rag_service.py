@@ -28,62 +28,249 @@ Embeddings convert text into vectors (lists of numbers) that capture semantic me
 - Enables semantic search (meaning-based, not keyword-based)
 """
 
+import asyncio
 import chromadb
 from chromadb.utils import embedding_functions
 from openai import OpenAI
-import json
-
+from sqlalchemy import select
+from sqlalchemy.orm import selectinload
+import orjson
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import AsyncIterator
+
+from cache_service import ThreadSafeTTLCache
 from config import settings
+from openai_client import async_client
 from database import SessionLocal
 from models import Recipe
+import numpy as np
+from vector_index import RecipeVectorIndex, normalize
 
 
 # =============================================================================
 # Initialize Services
 # =============================================================================
 
-# OpenAI client for embeddings
+# OpenAI client for embeddings (called from worker threads)
 openai_client = OpenAI(api_key=settings.OPENAI_API_KEY)
 
+EMBEDDING_MODEL = "text-embedding-3-small"  # Fast and cost-effective
+
+# The embeddings API accepts up to 2048 inputs per request, but smaller
+# batches sent in parallel finish sooner than one huge serial request.
+# Chroma rejects writes larger than ~5000 rows, so we batch writes to that.
+EMBEDDING_BATCH_SIZE = 512
+EMBEDDING_CONCURRENCY = 8
+CHROMA_MAX_BATCH = 5000
+
 # ChromaDB client - persistent storage
 chroma_client = chromadb.PersistentClient(path="./chroma_db")
 
 # OpenAI embedding function for ChromaDB
 openai_ef = embedding_functions.OpenAIEmbeddingFunction(
     api_key=settings.OPENAI_API_KEY,
-    model_name="text-embedding-3-small"  # Fast and cost-effective
+    model_name=EMBEDDING_MODEL
 )
 
-# Get or create recipe collection
-recipe_collection = chroma_client.get_or_create_collection(
-    name="recipes",
-    embedding_function=openai_ef,
-    metadata={"description": "Recipe embeddings for semantic search"}
-)
+COLLECTION_NAME = "recipes"
+
+
+def _get_or_create_collection():
+    """Open the recipe collection, creating it if needed."""
+    # Embeddings are unit length, so inner product == cosine similarity.
+    # (hnsw:space only takes effect when the collection is first created.)
+    return chroma_client.get_or_create_collection(
+        name=COLLECTION_NAME,
+        embedding_function=openai_ef,
+        metadata={
+            "description": "Recipe embeddings for semantic search",
+            "hnsw:space": "ip",
+        }
+    )
+
+
+recipe_collection = _get_or_create_collection()
+
+
+# =============================================================================
+# In-Process Vector Index
+# =============================================================================
+# Chroma persists our embeddings; searches run against an in-memory flat
+# index loaded from it (see vector_index.py). It's rebuilt lazily after
+# the collection changes.
+
+_vector_index: RecipeVectorIndex | None = None
+_vector_index_lock = threading.Lock()
+
+
+def _load_vector_index() -> RecipeVectorIndex:
+    """Load every stored embedding, document and metadata row from Chroma."""
+    stored = recipe_collection.get(include=["embeddings", "documents", "metadatas"])
+    return RecipeVectorIndex(
+        ids=[int(doc_id) for doc_id in stored["ids"]],
+        embeddings=stored["embeddings"],
+        documents=stored["documents"],
+        metadatas=stored["metadatas"],
+    )
+
+
+def get_vector_index() -> RecipeVectorIndex:
+    """Return the in-memory index, loading it from Chroma on first use."""
+    global _vector_index
+    index = _vector_index
+    if index is None:
+        with _vector_index_lock:
+            if _vector_index is None:
+                _vector_index = _load_vector_index()
+            index = _vector_index
+    return index
+
+
+def warm_up() -> None:
+    """
+    Load the vector index and make one embedding call before serving traffic.
+    
+    CONCEPT: Warmup
+    The first search otherwise pays for loading every vector from Chroma
+    and opening a fresh TLS connection to OpenAI. Doing it at startup means
+    the first real user sees steady-state latency.
+    """
+    index = get_vector_index()
+    print(f"[RAG] Vector index ready ({len(index)} recipes)")
+    
+    if settings.OPENAI_API_KEY:
+        embed_query("warmup")
+
+
+def _reset_vector_index() -> None:
+    """Forget the in-memory index (and cached searches) after the collection changes."""
+    global _vector_index
+    _vector_index = None
+    search_cache.clear()
+
+
+# Whether the collection holds any recipes. Chroma persists to disk, so we
+# ask it once after startup and then track it as we index/clear.
+_is_indexed: bool | None = None
+
+
+def is_indexed() -> bool:
+    """Cheap readiness check: has anything been indexed?"""
+    global _is_indexed
+    if _is_indexed is None:
+        try:
+            _is_indexed = recipe_collection.count() > 0
+        except Exception as e:
+            print(f"[RAG] Could not read collection: {e}")
+            return False
+    return _is_indexed
+
+
+def _set_indexed(value: bool) -> None:
+    global _is_indexed
+    _is_indexed = value
 
 
 # =============================================================================
 # Embedding Functions
 # =============================================================================
 
+def embed_documents(texts: list[str]) -> list[list[float]]:
+    """
+    Embed many documents with as few API calls as possible.
+    
+    CONCEPT: Batching
+    Letting Chroma embed documents itself means its embedding function is
+    invoked per write. Computing embeddings ourselves - one request per
+    512 documents - and passing them in turns N round trips into a handful.
+    
+    When there's more than one batch, up to EMBEDDING_CONCURRENCY requests
+    are in flight at once (the API call is network-bound, so threads do
+    fine); results are reassembled in the original order.
+    
+    Vectors are L2-normalized here, once, so every later similarity
+    comparison is a plain dot product.
+    """
+    batches = [
+        texts[start:start + EMBEDDING_BATCH_SIZE]
+        for start in range(0, len(texts), EMBEDDING_BATCH_SIZE)
+    ]
+    
+    if len(batches) <= 1:
+        results = [_embed_batch(batch) for batch in batches]
+    else:
+        with ThreadPoolExecutor(max_workers=min(EMBEDDING_CONCURRENCY, len(batches))) as pool:
+            results = list(pool.map(_embed_batch, batches))
+    
+    embeddings = [embedding for batch in results for embedding in batch]
+    return normalize(np.array(embeddings, dtype=np.float32)).tolist()
+
+
+def _embed_batch(texts: list[str]) -> list[list[float]]:
+    """One embeddings API request."""
+    response = openai_client.embeddings.create(model=EMBEDDING_MODEL, input=texts)
+    return [item.embedding for item in response.data]
+
+
+# CONCEPT: Query Embedding Cache
+# Users repeat themselves ("quick dinner", "vegan pasta"), and an embedding is
+# a pure function of the text - so each distinct query pays for the ~100-200ms
+# embeddings API round trip only once. Tuples keep cached vectors immutable.
+QUERY_EMBEDDING_CACHE_SIZE = 1024
+
+
+@lru_cache(maxsize=QUERY_EMBEDDING_CACHE_SIZE)
+def _cached_query_embedding(text: str) -> tuple[float, ...]:
+    return tuple(embed_documents([text])[0])
+
+
+def embed_query(text: str) -> list[float]:
+    """Embed (and normalize) a single search query, cached per query text."""
+    return list(_cached_query_embedding(text.strip()))
+
+
+# The embedded document layout lives in one place, so changing what gets
+# embedded is a one-line edit here rather than a hunt through the code
+RECIPE_DOCUMENT_TEMPLATE = (
+    "Recipe: {name}\n"
+    "Description: {description}\n"
+    "Cuisine: {cuisine}\n"
+    "Difficulty: {difficulty}\n"
+    "Ingredients: {ingredients}\n"
+    "Dietary Tags: {tags}\n"
+    "Cooking Time: {minutes} minutes"
+)
+
+
 def create_recipe_document(recipe: Recipe) -> str:
     """
     Create a rich text document from a recipe for embedding.
     
     The more context we include, the better the semantic search.
     """
-    ingredients = ", ".join([ing.name for ing in recipe.ingredients])
-    tags = ", ".join(recipe.dietary_tags) if recipe.dietary_tags else "none"
-    
-    return f"""
-Recipe: {recipe.name}
-Description: {recipe.description}
-Cuisine: {recipe.cuisine}
-Difficulty: {recipe.difficulty}
-Ingredients: {ingredients}
-Dietary Tags: {tags}
-Cooking Time: {recipe.prep_time_minutes + recipe.cook_time_minutes} minutes
-""".strip()
+    return RECIPE_DOCUMENT_TEMPLATE.format(
+        name=recipe.name,
+        description=recipe.description,
+        cuisine=recipe.cuisine,
+        difficulty=recipe.difficulty,
+        ingredients=", ".join([ing.name for ing in recipe.ingredients]),
+        tags=", ".join(recipe.dietary_tags) if recipe.dietary_tags else "none",
+        # Either time may be missing on user-created recipes
+        minutes=(recipe.prep_time_minutes or 0) + (recipe.cook_time_minutes or 0),
+    )
+
+
+def recipe_metadata(recipe: Recipe) -> dict:
+    """Filterable metadata stored alongside each recipe's embedding."""
+    return {
+        "name": recipe.name,
+        "cuisine": recipe.cuisine or "",
+        "difficulty": recipe.difficulty or "",
+        "dietary_tags": ",".join(recipe.dietary_tags) if recipe.dietary_tags else "",
+    }
 
 
 def index_single_recipe(recipe: Recipe) -> bool:
@@ -94,19 +281,23 @@ def index_single_recipe(recipe: Recipe) -> bool:
         recipe_collection.upsert(
             ids=[str(recipe.id)],
             documents=[doc],
-            metadatas=[{
-                "name": recipe.name,
-                "cuisine": recipe.cuisine or "",
-                "difficulty": recipe.difficulty or "",
-                "dietary_tags": ",".join(recipe.dietary_tags) if recipe.dietary_tags else "",
-            }]
+            embeddings=embed_documents([doc]),
+            metadatas=[recipe_metadata(recipe)]
         )
+        _reset_vector_index()
+        _set_indexed(True)
         return True
     except Exception as e:
         print(f"Error indexing recipe {recipe.id}: {e}")
         return False
 
 
+# Every recipe with its ingredients in two queries (recipes, then one IN query
+# for all their ingredients) instead of one extra query per recipe.
+# Built once at import; SQLAlchemy caches its compiled form after first use.
+_ALL_RECIPES_WITH_INGREDIENTS = select(Recipe).options(selectinload(Recipe.ingredients))
+
+
 def index_all_recipes() -> dict:
     """
     Index all recipes from the database into ChromaDB.
@@ -116,32 +307,29 @@ def index_all_recipes() -> dict:
     """
     db = SessionLocal()
     try:
-        recipes = db.query(Recipe).all()
+        recipes = db.scalars(_ALL_RECIPES_WITH_INGREDIENTS).all()
         
         if not recipes:
             return {"success": False, "message": "No recipes found in database"}
         
-        documents = []
-        ids = []
-        metadatas = []
+        documents = [create_recipe_document(recipe) for recipe in recipes]
+        ids = [str(recipe.id) for recipe in recipes]
+        metadatas = [recipe_metadata(recipe) for recipe in recipes]
         
-        for recipe in recipes:
-            doc = create_recipe_document(recipe)
-            documents.append(doc)
-            ids.append(str(recipe.id))
-            metadatas.append({
-                "name": recipe.name,
-                "cuisine": recipe.cuisine or "",
-                "difficulty": recipe.difficulty or "",
-                "dietary_tags": ",".join(recipe.dietary_tags) if recipe.dietary_tags else "",
-            })
+        # Embed everything up front, then write in as few batches as possible
+        embeddings = embed_documents(documents)
         
-        # Upsert all at once (more efficient)
-        recipe_collection.upsert(
-            ids=ids,
-            documents=documents,
-            metadatas=metadatas
-        )
+        for start in range(0, len(ids), CHROMA_MAX_BATCH):
+            end = start + CHROMA_MAX_BATCH
+            recipe_collection.upsert(
+                ids=ids[start:end],
+                documents=documents[start:end],
+                embeddings=embeddings[start:end],
+                metadatas=metadatas[start:end]
+            )
+        
+        _reset_vector_index()
+        _set_indexed(True)
         
         return {
             "success": True,
@@ -159,6 +347,33 @@ def index_all_recipes() -> dict:
 # Semantic Search
 # =============================================================================
 
+def _search_index(
+    index: RecipeVectorIndex,
+    query_embedding: list[float],
+    n_results: int = 5,
+    cuisine_filter: str | None = None,
+    dietary_filter: list[str] | None = None
+) -> list[dict]:
+    """Rank recipes against an embedded query, applying the metadata filters."""
+    
+    # Both filters are applied INSIDE the search, so we get the top
+    # n_results matching recipes - filtering the top n_results afterwards
+    # could leave nothing even when matching recipes exist.
+    
+    # Cuisine must match exactly (same as Chroma's {"$eq": ...} filter)
+    where_filter = None
+    if cuisine_filter:
+        where_filter = lambda metadata: metadata.get("cuisine") == cuisine_filter
+    
+    # Any one of the requested dietary tags is enough (checked with a bitmask)
+    return index.search(
+        query_embedding=query_embedding,
+        n_results=n_results,
+        where=where_filter,
+        dietary_filter=dietary_filter
+    )
+
+
 def semantic_search(
     query: str,
     n_results: int = 5,
@@ -173,142 +388,203 @@ def semantic_search(
     - "comfort food for cold weather" finds hearty soups/stews
     - "something with leftovers" finds creative leftover recipes
     """
-    
-    # Build where filter for metadata
-    where_filter = None
-    if cuisine_filter:
-        where_filter = {"cuisine": {"$eq": cuisine_filter}}
-    
     try:
-        results = recipe_collection.query(
-            query_texts=[query],
-            n_results=n_results,
-            where=where_filter
-        )
-        
-        if not results or not results['ids'] or not results['ids'][0]:
+        index = get_vector_index()
+        if not len(index):
             return []
         
-        # Format results
-        search_results = []
-        for i, doc_id in enumerate(results['ids'][0]):
-            result = {
-                "id": int(doc_id),
-                "document": results['documents'][0][i] if results['documents'] else "",
-                "metadata": results['metadatas'][0][i] if results['metadatas'] else {},
-                "distance": results['distances'][0][i] if results['distances'] else 0,
-            }
-            
-            # Filter by dietary tags if specified
-            if dietary_filter:
-                recipe_tags = result['metadata'].get('dietary_tags', '').split(',')
-                if not any(tag in recipe_tags for tag in dietary_filter):
-                    continue
-                    
-            search_results.append(result)
-        
-        return search_results
+        return _search_index(index, embed_query(query), n_results, cuisine_filter, dietary_filter)
         
     except Exception as e:
         print(f"Search error: {e}")
         return []
 
 
-# =============================================================================
-# RAG Pipeline
-# =============================================================================
+# CONCEPT: Conversation-Scoped Search Cache
+# Voice conversations re-run nearly the same search turn after turn
+# ("what can I make?" / "What can I make"). Results are cached for about
+# the length of a cooking session, keyed on a loosely normalized query.
+# Searches run in worker threads and indexing clears the cache from its own
+# thread, so this one needs the thread-safe variant.
+search_cache = ThreadSafeTTLCache(maxsize=256, ttl=1800)
 
-async def rag_recipe_suggestions(
+_NON_WORD = re.compile(r"[^\w\s]")
+
+
+def normalize_search_text(text: str) -> str:
+    """Lowercase, drop punctuation and collapse whitespace."""
+    return " ".join(_NON_WORD.sub(" ", text.lower()).split())
+
+
+def cached_semantic_search(
     query: str,
-    ingredients: list[str] | None = None,
-    dietary_restrictions: list[str] | None = None,
-    cuisine_preference: str | None = None
-) -> dict:
+    n_results: int = 5,
+    cuisine_filter: str | None = None,
+    dietary_filter: list[str] | None = None
+) -> list[dict]:
+    """semantic_search, answered from search_cache when a similar query was just run."""
+    key = (
+        normalize_search_text(query),
+        n_results,
+        cuisine_filter,
+        tuple(sorted(dietary_filter or [])),
+    )
+    results = search_cache.get(key)
+    if results is None:
+        results = semantic_search(query, n_results, cuisine_filter, dietary_filter)
+        if results:  # An empty result may just mean nothing is indexed yet
+            search_cache.set(key, results)
+    return results
+
+
+def semantic_search_batch(searches: list[dict]) -> list[list[dict]]:
     """
-    RAG-powered recipe suggestions.
+    Run several semantic searches at once.
     
-    This is the magic combination:
-    1. Semantic search finds relevant recipes from YOUR database
-    2. LLM creates personalized suggestions based on found recipes
-    3. Results are grounded in real data, not hallucinated
+    Each search is a dict of semantic_search's keyword arguments. All the
+    queries are embedded in ONE embeddings request instead of one each, then
+    ranked against the in-memory index. Returns one result list per search.
     """
-    
-    # Step 1: Build a rich search query
-    search_query = query
-    if ingredients:
-        search_query += f" using {', '.join(ingredients)}"
-    if cuisine_preference:
-        search_query += f" {cuisine_preference} cuisine"
-    if dietary_restrictions:
-        search_query += f" {', '.join(dietary_restrictions)}"
-    
-    # Step 2: Retrieve relevant recipes
-    similar_recipes = semantic_search(
-        query=search_query,
-        n_results=5,
-        cuisine_filter=cuisine_preference,
-        dietary_filter=dietary_restrictions
-    )
-    
-    if not similar_recipes:
-        return {
-            "success": False,
-            "message": "No matching recipes found. Try indexing recipes first.",
-            "suggestions": []
-        }
-    
-    # Step 3: Prepare context for LLM
-    recipe_context = "\n\n".join([
-        f"Recipe {i+1}:\n{r['document']}"
-        for i, r in enumerate(similar_recipes)
-    ])
-    
-    # Step 4: Generate response with LLM
-    system_prompt = """You are a helpful cooking assistant. You will be given recipes 
+    try:
+        index = get_vector_index()
+        if not len(index):
+            return [[] for _ in searches]
+        
+        embeddings = embed_documents([search["query"].strip() for search in searches])
+        return [
+            _search_index(
+                index,
+                embedding,
+                n_results=search.get("n_results", 5),
+                cuisine_filter=search.get("cuisine_filter"),
+                dietary_filter=search.get("dietary_filter"),
+            )
+            for search, embedding in zip(searches, embeddings)
+        ]
+        
+    except Exception as e:
+        print(f"Search error: {e}")
+        return [[] for _ in searches]
+
+
+# =============================================================================
+# RAG Pipeline
+# =============================================================================
+
+# CONCEPT: Static Prompt First
+# Every piece of text that never changes - instructions AND the JSON format -
+# lives in the system message, and everything request-specific (the user's
+# query, the retrieved recipes) comes after it, at the very end. This is about
+# structure: the fixed instructions are in one place. (OpenAI's automatic
+# prefix caching only starts at 1024 tokens; this prefix is ~230, so there
+# is no caching discount at its current size.)
+RAG_SYSTEM_PROMPT = """You are a helpful cooking assistant. You will be given recipes 
 from our database and the user's query. Your job is to:
 1. Analyze the relevant recipes provided
 2. Suggest which ones best match the user's needs
 3. Provide helpful modifications based on their ingredients/preferences
 4. Be specific and reference the actual recipes provided
 
-Always base your suggestions on the recipes given - don't make up new ones."""
-
-    user_prompt = f"""User's request: {query}
-
-User's available ingredients: {', '.join(ingredients) if ingredients else 'Not specified'}
-Dietary restrictions: {', '.join(dietary_restrictions) if dietary_restrictions else 'None'}
-Cuisine preference: {cuisine_preference or 'Any'}
-
-Here are relevant recipes from our database:
-
-{recipe_context}
+Always base your suggestions on the recipes given - don't make up new ones.
 
-Based on these recipes, provide personalized suggestions. Format as JSON:
-{{
+Based on the recipes provided, give personalized suggestions. Format as JSON:
+{
     "recommendations": [
-        {{
+        {
             "recipe_name": "Name from database",
             "recipe_id": <id number>,
             "why_recommended": "Brief explanation",
             "modifications": "Any suggested changes based on user's ingredients",
             "missing_ingredients": ["list of items they may need"]
-        }}
+        }
     ],
     "general_tips": "Overall cooking advice based on their request"
-}}"""
+}"""
+
+# The user message: only request-specific text, after the static prefix
+RAG_REQUEST_TEMPLATE = """User's request: {query}
+
+User's available ingredients: {ingredients}
+Dietary restrictions: {dietary_restrictions}
+Cuisine preference: {cuisine_preference}"""
+
+RAG_USER_PROMPT_TEMPLATE = """{request_summary}
+
+Here are relevant recipes from our database:
+
+{recipes}"""
+
+
+def _rag_search_query(
+    query: str,
+    ingredients: list[str] | None,
+    dietary_restrictions: list[str] | None,
+    cuisine_preference: str | None
+) -> str:
+    """Build a rich search query from the request."""
+    search_query = query
+    if ingredients:
+        search_query += f" using {', '.join(ingredients)}"
+    if cuisine_preference:
+        search_query += f" {cuisine_preference} cuisine"
+    if dietary_restrictions:
+        search_query += f" {', '.join(dietary_restrictions)}"
+    return search_query
+
+
+def _rag_request_summary(
+    query: str,
+    ingredients: list[str] | None,
+    dietary_restrictions: list[str] | None,
+    cuisine_preference: str | None
+) -> str:
+    """The part of the user prompt that doesn't depend on retrieval."""
+    return RAG_REQUEST_TEMPLATE.format(
+        query=query,
+        ingredients=', '.join(ingredients) if ingredients else 'Not specified',
+        dietary_restrictions=', '.join(dietary_restrictions) if dietary_restrictions else 'None',
+        cuisine_preference=cuisine_preference or 'Any',
+    )
+
+
+# No recipes retrieved - nothing to ground an answer in
+NO_RECIPES_RESULT = {
+    "success": False,
+    "message": "No matching recipes found. Try indexing recipes first.",
+    "suggestions": []
+}
+
+
+def _rag_messages(request_summary: str, similar_recipes: list[dict]) -> list[dict]:
+    """Chat messages asking the LLM for suggestions grounded in the retrieved recipes."""
+    recipe_context = "\n\n".join([
+        f"Recipe {i+1}:\n{r['document']}"
+        for i, r in enumerate(similar_recipes)
+    ])
+    
+    user_prompt = RAG_USER_PROMPT_TEMPLATE.format(request_summary=request_summary, recipes=recipe_context)
+    
+    return [
+        {"role": "system", "content": RAG_SYSTEM_PROMPT},
+        {"role": "user", "content": user_prompt}
+    ]
+
+
+async def _rag_answer(request_summary: str, search_query: str, similar_recipes: list[dict]) -> dict:
+    """Have the LLM write suggestions grounded in the retrieved recipes."""
+    if not similar_recipes:
+        return dict(NO_RECIPES_RESULT)
 
     try:
-        response = openai_client.chat.completions.create(
+        # Async client: several RAG requests can wait on OpenAI at once
+        response = await async_client.chat.completions.create(
             model="gpt-4o-mini",
-            messages=[
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": user_prompt}
-            ],
+            messages=_rag_messages(request_summary, similar_recipes),
             response_format={"type": "json_object"},
             temperature=0.7,
         )
         
-        result = json.loads(response.choices[0].message.content)
+        result = orjson.loads(response.choices[0].message.content)
         
         return {
             "success": True,
@@ -325,6 +601,209 @@ Based on these recipes, provide personalized suggestions. Format as JSON:
         }
 
 
+async def rag_recipe_suggestions(
+    query: str,
+    ingredients: list[str] | None = None,
+    dietary_restrictions: list[str] | None = None,
+    cuisine_preference: str | None = None
+) -> dict:
+    """
+    RAG-powered recipe suggestions.
+    
+    This is the magic combination:
+    1. Semantic search finds relevant recipes from YOUR database
+    2. LLM creates personalized suggestions based on found recipes
+    3. Results are grounded in real data, not hallucinated
+    """
+    
+    # Step 1: Build a rich search query
+    search_query = _rag_search_query(query, ingredients, dietary_restrictions, cuisine_preference)
+    
+    # Step 2: Start retrieving relevant recipes
+    # (embedding the query is a blocking network call - keep it off the event
+    # loop, and build the rest of the prompt while it's in flight)
+    retrieval = asyncio.create_task(asyncio.to_thread(
+        semantic_search,
+        query=search_query,
+        n_results=5,
+        cuisine_filter=cuisine_preference,
+        dietary_filter=dietary_restrictions
+    ))
+    
+    # Step 3: Prepare the parts of the prompt that don't depend on retrieval
+    request_summary = _rag_request_summary(query, ingredients, dietary_restrictions, cuisine_preference)
+    
+    # Step 4: Generate response with LLM
+    return await _rag_answer(request_summary, search_query, await retrieval)
+
+
+class StreamingArrayParser:
+    """
+    Pull complete elements out of one JSON array while the JSON is still arriving.
+    
+    CONCEPT: Incremental Parsing
+    The LLM writes {"recommendations": [{...}, {...}], ...} a few characters
+    at a time. Rather than waiting for the closing brace, we track nesting
+    depth (ignoring brackets inside strings) and parse each array element
+    the moment its own closing brace arrives.
+    
+        parser = StreamingArrayParser("recommendations")
+        for chunk in chunks:
+            for item in parser.feed(chunk):
+                ...
+    """
+    
+    def __init__(self, key: str):
+        self._marker = f'"{key}"'
+        self._buffer = ""
+        self._pos: int | None = None  # Scan position, once inside the array
+        self._depth = 0
+        self._in_string = False
+        self._escaped = False
+        self._item_start = 0
+        self._done = False
+    
+    def feed(self, chunk: str) -> list:
+        """Add more JSON text; return the array elements completed by it."""
+        items = []
+        if self._done:
+            return items
+        self._buffer += chunk
+        
+        if self._pos is None:
+            key_at = self._buffer.find(self._marker)
+            open_at = self._buffer.find("[", key_at + len(self._marker)) if key_at >= 0 else -1
+            if open_at < 0:
+                return items
+            self._pos = open_at + 1
+        
+        buffer = self._buffer
+        i = self._pos
+        while i < len(buffer):
+            char = buffer[i]
+            if self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                elif char == "\\":
+                    self._escaped = True
+                elif char == '"':
+                    self._in_string = False
+            elif char == '"':
+                self._in_string = True
+            elif char in "{[":
+                if self._depth == 0:
+                    self._item_start = i
+                self._depth += 1
+            elif char in "}]":
+                if self._depth == 0:
+                    # The array's own closing bracket
+                    self._done = True
+                    break
+                self._depth -= 1
+                if self._depth == 0:
+                    items.append(orjson.loads(buffer[self._item_start:i + 1]))
+            i += 1
+        
+        # Drop the scanned text (keeping an unfinished element) so the buffer
+        # holds at most one element - not the whole reply copied per token
+        keep = self._item_start if self._depth > 0 else i
+        self._buffer = buffer[keep:]
+        self._item_start -= keep
+        self._pos = i - keep
+        return items
+
+
+async def rag_recipe_suggestions_stream(
+    query: str,
+    ingredients: list[str] | None = None,
+    dietary_restrictions: list[str] | None = None,
+    cuisine_preference: str | None = None
+) -> AsyncIterator[tuple[str, dict]]:
+    """
+    Streaming version of rag_recipe_suggestions.
+    
+    Yields ("recommendation", item) for each recommendation as soon as the
+    LLM has finished writing it, then ("final", result) with the same
+    result dict rag_recipe_suggestions returns.
+    """
+    search_query = _rag_search_query(query, ingredients, dietary_restrictions, cuisine_preference)
+    retrieval = asyncio.create_task(asyncio.to_thread(
+        semantic_search,
+        query=search_query,
+        n_results=5,
+        cuisine_filter=cuisine_preference,
+        dietary_filter=dietary_restrictions
+    ))
+    request_summary = _rag_request_summary(query, ingredients, dietary_restrictions, cuisine_preference)
+    similar_recipes = await retrieval
+    
+    if not similar_recipes:
+        yield "final", dict(NO_RECIPES_RESULT)
+        return
+    
+    stream = await async_client.chat.completions.create(
+        model="gpt-4o-mini",
+        messages=_rag_messages(request_summary, similar_recipes),
+        response_format={"type": "json_object"},
+        temperature=0.7,
+        stream=True,
+    )
+    
+    parser = StreamingArrayParser("recommendations")
+    parts = []
+    async for chunk in stream:
+        if not (chunk.choices and chunk.choices[0].delta.content):
+            continue
+        token = chunk.choices[0].delta.content
+        parts.append(token)
+        for item in parser.feed(token):
+            yield "recommendation", item
+    
+    yield "final", {
+        "success": True,
+        "data": orjson.loads("".join(parts)),
+        "retrieved_recipes": len(similar_recipes),
+        "search_query": search_query
+    }
+
+
+async def rag_recipe_suggestions_batch(requests: list[dict]) -> list[dict]:
+    """
+    RAG suggestions for several requests at once.
+    
+    Each request is a dict of rag_recipe_suggestions' keyword arguments.
+    Retrieval for all of them is one embeddings call (semantic_search_batch),
+    and the LLM calls run concurrently. Returns one result per request, in order.
+    """
+    search_queries = [
+        _rag_search_query(
+            r["query"], r.get("ingredients"), r.get("dietary_restrictions"), r.get("cuisine_preference")
+        )
+        for r in requests
+    ]
+    
+    retrieved = await asyncio.to_thread(semantic_search_batch, [
+        {
+            "query": search_query,
+            "n_results": 5,
+            "cuisine_filter": r.get("cuisine_preference"),
+            "dietary_filter": r.get("dietary_restrictions"),
+        }
+        for r, search_query in zip(requests, search_queries)
+    ])
+    
+    return await asyncio.gather(*(
+        _rag_answer(
+            _rag_request_summary(
+                r["query"], r.get("ingredients"), r.get("dietary_restrictions"), r.get("cuisine_preference")
+            ),
+            search_query,
+            similar_recipes,
+        )
+        for r, search_query, similar_recipes in zip(requests, search_queries, retrieved)
+    ))
+
+
 # =============================================================================
 # Collection Management
 # =============================================================================
@@ -336,7 +815,7 @@ def get_collection_stats() -> dict:
         return {
             "collection_name": "recipes",
             "document_count": count,
-            "embedding_model": "text-embedding-3-small"
+            "embedding_model": EMBEDDING_MODEL
         }
     except Exception as e:
         return {"error": str(e)}
@@ -344,12 +823,16 @@ def get_collection_stats() -> dict:
 
 def clear_collection() -> dict:
     """Clear all documents from the collection."""
+    global recipe_collection
     try:
-        # Get all IDs and delete them
-        all_docs = recipe_collection.get()
-        if all_docs['ids']:
-            recipe_collection.delete(ids=all_docs['ids'])
-        return {"success": True, "deleted_count": len(all_docs['ids'])}
+        # Drop and recreate the collection rather than fetching every
+        # document just to learn the IDs to delete
+        deleted_count = recipe_collection.count()
+        chroma_client.delete_collection(COLLECTION_NAME)
+        recipe_collection = _get_or_create_collection()
+        _reset_vector_index()
+        _set_indexed(False)
+        return {"success": True, "deleted_count": deleted_count}
     except Exception as e:
         return {"success": False, "error": str(e)}
 
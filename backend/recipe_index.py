@@ -0,0 +1,213 @@
+"""
+🔎 Recipe Ingredient Index
+
+CONCEPT: Inverted Index
+
+The naive way to match a user's ingredients against recipes is to loop over
+every recipe, every recipe ingredient, and every user ingredient, doing a
+substring check each time. That's O(recipes × ingredients × user_ingredients)
+Python work on EVERY request.
+
+Instead we split the work:
+1. This index resolves each user ingredient to the exact ingredient names
+   in our catalog that match it (a small, in-memory lookup)
+2. The database then counts matches per recipe with a GROUP BY, ranks them
+   and returns only the top results - no recipe rows cross the wire just
+   to be thrown away
+
+We build the index once (lazily, on first use) and throw it away whenever
+ingredients change, so the next request rebuilds it.
+
+The same goes for the handful of example recipes we hand GPT-4 as context
+in AI suggestions - they rarely change, so we keep them in memory too.
+
+CONCEPT: N-gram Shingles
+
+Users type "chicken" but the database says "chicken breast". To keep the
+original substring matching without scanning every name, we also index
+3-character "shingles" of each ingredient name:
+    "garlic" -> {"gar", "arl", "rli", "lic"}
+Any name containing "garlic" must contain all of those shingles, so
+intersecting their posting lists gives a tiny candidate set to verify.
+"""
+
+import threading
+from typing import Callable
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from database import SessionLocal
+from models import Ingredient, Recipe
+
+
+SHINGLE_SIZE = 3
+
+# How many existing recipes to show the LLM as examples
+RECIPE_CONTEXT_SIZE = 5
+
+
+def _shingles(text: str) -> set[str]:
+    """Split text into overlapping n-character shingles."""
+    return {text[i:i + SHINGLE_SIZE] for i in range(len(text) - SHINGLE_SIZE + 1)}
+
+
+class IngredientIndex:
+    """
+    In-memory index over every ingredient name in the catalog.
+
+    Matching semantics are the same as the original endpoint: an ingredient
+    matches if a user ingredient is a substring of it, or it is a substring
+    of the user ingredient.
+    """
+
+    def __init__(self, ingredient_names: list[str]):
+        # Lowercased ingredient names
+        self.names: set[str] = set(ingredient_names)
+
+        # shingle -> ingredient names containing it
+        self.shingle_index: dict[str, set[str]] = {}
+        for name in self.names:
+            for shingle in _shingles(name):
+                self.shingle_index.setdefault(shingle, set()).add(name)
+
+    def match_names(self, user_ingredient: str) -> set[str]:
+        """Find every ingredient name that matches a user ingredient."""
+        names = self.names
+
+        # Case 1: the ingredient name is inside what the user typed
+        # ("chicken" matches "boneless chicken"). Check every substring.
+        length = len(user_ingredient)
+        matched = {
+            user_ingredient[i:j]
+            for i in range(length)
+            for j in range(i + 1, length + 1)
+            if user_ingredient[i:j] in names
+        }
+
+        # Case 2: what the user typed is inside the ingredient name
+        # ("chicken" matches "chicken breast"). Narrow with shingles first.
+        if len(user_ingredient) < SHINGLE_SIZE:
+            candidates = names
+        else:
+            postings = [self.shingle_index.get(s, set()) for s in _shingles(user_ingredient)]
+            candidates = set.intersection(*postings) if postings else set()
+
+        matched.update(name for name in candidates if user_ingredient in name)
+        return matched
+
+    def match(self, user_ingredients: list[str]) -> set[str]:
+        """Resolve all user ingredients to the set of matching ingredient names."""
+        matched_names: set[str] = set()
+        for user_ing in user_ingredients:
+            matched_names |= self.match_names(user_ing)
+        return matched_names
+
+
+# =============================================================================
+# Shared Index (built lazily, invalidated on writes)
+# =============================================================================
+
+_index: IngredientIndex | None = None
+_index_lock = threading.Lock()
+
+
+def build_index() -> IngredientIndex:
+    """Load every ingredient name from the database and index them."""
+    db = SessionLocal()
+    try:
+        return IngredientIndex([name for (name,) in db.query(Ingredient.name_lower).all() if name])
+    finally:
+        db.close()
+
+
+def get_index() -> IngredientIndex:
+    """Return the shared index, building it on first use."""
+    global _index
+    index = _index
+    if index is None:
+        with _index_lock:
+            if _index is None:
+                _index = build_index()
+            index = _index
+    return index
+
+
+# =============================================================================
+# Shared AI Recipe Context
+# =============================================================================
+
+_recipe_context: list[dict] | None = None
+
+
+def build_recipe_context() -> list[dict]:
+    """Summarize a few existing recipes for the AI suggestion prompt."""
+    db = SessionLocal()
+    try:
+        rows = (
+            db.query(Recipe.name, Recipe.description, Recipe.cuisine)
+            .limit(RECIPE_CONTEXT_SIZE)
+            .all()
+        )
+        return [
+            {"name": name, "description": description, "cuisine": cuisine}
+            for name, description, cuisine in rows
+        ]
+    finally:
+        db.close()
+
+
+def get_recipe_context() -> list[dict]:
+    """Return the shared recipe context, building it on first use."""
+    global _recipe_context
+    context = _recipe_context
+    if context is None:
+        with _index_lock:
+            if _recipe_context is None:
+                _recipe_context = build_recipe_context()
+            context = _recipe_context
+    return context
+
+
+# Other caches derived from recipes/ingredients (see on_invalidate)
+_invalidation_callbacks: list[Callable[[], None]] = []
+
+
+def on_invalidate(callback: Callable[[], None]) -> None:
+    """Register a callback to run whenever recipe or ingredient data changes."""
+    _invalidation_callbacks.append(callback)
+
+
+def invalidate() -> None:
+    """Drop the shared index and recipe context so the next request rebuilds them."""
+    global _index, _recipe_context
+    _index = None
+    _recipe_context = None
+    for callback in _invalidation_callbacks:
+        callback()
+
+
+# CONCEPT: ORM Events
+# SQLAlchemy calls these hooks whenever a row is written through the ORM.
+# Writes are only visible to other sessions after COMMIT, so we just remember
+# that something changed and drop the index once the transaction commits.
+_pending_invalidation = False
+
+
+def _mark_changed(mapper, connection, target) -> None:
+    global _pending_invalidation
+    _pending_invalidation = True
+
+
+def _invalidate_after_commit(session) -> None:
+    global _pending_invalidation
+    if _pending_invalidation:
+        _pending_invalidation = False
+        invalidate()
+
+
+for _event_name in ("after_insert", "after_update", "after_delete"):
+    event.listen(Ingredient, _event_name, _mark_changed)
+    event.listen(Recipe, _event_name, _mark_changed)
+
+event.listen(Session, "after_commit", _invalidate_after_commit)
@@ -20,7 +20,7 @@ Why separate?
 - Separation of concerns = cleaner code
 """
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from datetime import datetime
 
 
@@ -38,8 +38,8 @@ class IngredientResponse(IngredientBase):
     id: int
     category: str | None = None
     
-    class Config:
-        from_attributes = True  # Allow creating from SQLAlchemy models
+    # Allow creating from SQLAlchemy models
+    model_config = ConfigDict(from_attributes=True)
 
 
 # =============================================================================
@@ -77,8 +77,7 @@ class RecipeResponse(RecipeBase):
     image_url: str | None = None
     created_at: datetime | None = None
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class RecipeSummary(BaseModel):
@@ -92,8 +91,7 @@ class RecipeSummary(BaseModel):
     dietary_tags: list[str] = []
     image_url: str | None = None
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 # =============================================================================
@@ -145,6 +143,5 @@ class UserPreferencesResponse(UserPreferencesBase):
     """User preferences as returned by API."""
     id: int
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
@@ -11,8 +11,10 @@ This is useful for:
 Run this script with: python seed_data.py
 """
 
+from sqlalchemy import case, update
+
 from database import SessionLocal, engine, Base
-from models import Recipe, Ingredient
+from models import Recipe, Ingredient, normalize_ingredient_name, recipe_ingredients
 
 # Sample recipes data with images from Unsplash
 RECIPES_DATA = [
@@ -331,38 +333,56 @@ def seed_database():
             print("   To reseed, first clear the tables: TRUNCATE recipes, ingredients, recipe_ingredients CASCADE;")
             return
         
-        # Create a cache for ingredients to avoid duplicates
-        ingredient_cache = {}
+        # Every ingredient name used by any recipe, normalized
+        all_ingredient_names = {
+            normalize_ingredient_name(ingredient_name)
+            for recipe_data in RECIPES_DATA
+            for ingredient_name, _ in recipe_data["ingredients"]
+        }
+        
+        # CONCEPT: Batch lookups
+        # One SELECT ... WHERE name IN (...) for all of them, instead of one
+        # query per ingredient per recipe
+        ingredient_cache = {
+            ingredient.name: ingredient
+            for ingredient in db.query(Ingredient).filter(
+                Ingredient.name.in_(all_ingredient_names)
+            ).all()
+        }
+        
+        # Create the ones we don't have yet in a single flush
+        new_ingredients = [
+            Ingredient(name=name)
+            for name in sorted(all_ingredient_names - ingredient_cache.keys())
+        ]
+        db.add_all(new_ingredients)
+        db.flush()  # Get the IDs
+        ingredient_cache.update((ingredient.name, ingredient) for ingredient in new_ingredients)
         
+        # Build every Recipe first, then insert them all in one flush
+        recipes = []
+        recipe_ingredient_lists = []
         for recipe_data in RECIPES_DATA:
             # Extract ingredients from recipe data
-            ingredients_list = recipe_data.pop("ingredients")
-            
-            # Create Recipe object
-            recipe = Recipe(**recipe_data)
-            
-            # Process ingredients
-            for ingredient_name, quantity in ingredients_list:
-                # Normalize ingredient name
-                ing_name = ingredient_name.lower().strip()
-                
-                # Get or create ingredient
-                if ing_name not in ingredient_cache:
-                    ingredient = db.query(Ingredient).filter(
-                        Ingredient.name == ing_name
-                    ).first()
-                    
-                    if not ingredient:
-                        ingredient = Ingredient(name=ing_name)
-                        db.add(ingredient)
-                        db.flush()  # Get the ID
-                    
-                    ingredient_cache[ing_name] = ingredient
-                
-                # Add ingredient to recipe
-                recipe.ingredients.append(ingredient_cache[ing_name])
-            
-            db.add(recipe)
+            recipe_ingredient_lists.append(recipe_data.pop("ingredients"))
+            recipes.append(Recipe(**recipe_data))
+        
+        db.add_all(recipes)
+        db.flush()  # Get the recipe IDs
+        
+        # Link recipes to ingredients with one multi-row INSERT into the
+        # junction table (which also records each quantity)
+        db.execute(recipe_ingredients.insert(), [
+            {
+                "recipe_id": recipe.id,
+                "ingredient_id": ingredient_cache[normalize_ingredient_name(ingredient_name)].id,
+                "quantity": quantity,
+            }
+            for recipe, ingredients_list in zip(recipes, recipe_ingredient_lists)
+            for ingredient_name, quantity in ingredients_list
+        ])
+        
+        for recipe in recipes:
             print(f"  ✅ Added: {recipe.name}")
         
         db.commit()
@@ -388,25 +408,22 @@ def update_recipe_images():
     
     db = SessionLocal()
     
-    # Map recipe names to their image URLs
-    image_map = {
-        "Classic Spaghetti Carbonara": "https://images.unsplash.com/photo-1612874742237-6526221588e3?w=800&q=80",
-        "Thai Green Curry": "https://images.unsplash.com/photo-1455619452474-d2be8b1e70cd?w=800&q=80",
-        "Simple Pasta Aglio e Olio": "https://images.unsplash.com/photo-1563379926898-05f4575a45d8?w=800&q=80",
-        "Chicken Tikka Masala": "https://images.unsplash.com/photo-1565557623262-b51c2513a641?w=800&q=80",
-        "Vegetable Stir Fry": "https://images.unsplash.com/photo-1512058564366-18510be2db19?w=800&q=80",
-        "Classic Beef Tacos": "https://images.unsplash.com/photo-1551504734-5ee1c4a1479b?w=800&q=80",
-        "Mushroom Risotto": "https://images.unsplash.com/photo-1476124369491-e7addf5db371?w=800&q=80",
-        "Honey Garlic Salmon": "https://images.unsplash.com/photo-1467003909585-2f8a72700288?w=800&q=80",
-        "Greek Salad": "https://images.unsplash.com/photo-1540189549336-e6e99c3679fe?w=800&q=80",
-        "Japanese Miso Soup": "https://images.unsplash.com/photo-1547592166-23ac45744acd?w=800&q=80",
-    }
+    # Map recipe names to their image URLs (the seed data is the one source)
+    image_map = {r["name"]: r["image_url"] for r in RECIPES_DATA if r.get("image_url")}
     
     try:
-        for name, image_url in image_map.items():
-            recipe = db.query(Recipe).filter(Recipe.name == name).first()
-            if recipe:
-                recipe.image_url = image_url
+        # One UPDATE for every recipe:
+        #   SET image_url = CASE name WHEN 'Greek Salad' THEN '...' ... END
+        updated = set(db.scalars(
+            update(Recipe)
+            .where(Recipe.name.in_(image_map))
+            .values(image_url=case(image_map, value=Recipe.name))
+            .returning(Recipe.name)
+            .execution_options(synchronize_session=False)
+        ).all())
+        
+        for name in image_map:
+            if name in updated:
                 print(f"  ✅ Updated: {name}")
             else:
                 print(f"  ⚠️  Not found: {name}")
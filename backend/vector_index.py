@@ -0,0 +1,228 @@
+"""
+📐 Vector Index - In-Process Similarity Search
+
+CONCEPT: Flat (Brute-Force) Index
+
+For a recipe collection (hundreds to tens of thousands of documents), the
+fastest search is often the simplest: compare the query against EVERY
+stored vector with one matrix multiply. There's no approximate graph to
+walk and no client/server hop - just a BLAS call in our own process.
+
+FAISS's IndexFlatIP does exactly this ("IP" = inner product). If FAISS
+isn't installed we fall back to the same computation with numpy.
+
+CONCEPT: Cosine Similarity as a Dot Product
+
+Cosine similarity is dot(a, b) / (|a| * |b|). If every vector has length 1,
+that's just dot(a, b) - so rag_service L2-normalizes embeddings once, when
+they're created, and every comparison here is a single inner product with
+no norms or division. Collections indexed before that change may still hold
+raw vectors, so the index also normalizes everything once at load time
+(a no-op for vectors that are already unit length).
+
+CONCEPT: Scalar Quantization + Re-ranking
+
+A 1536-dim float32 embedding is 6KB, and a flat scan is limited by how fast
+we can stream those bytes from memory. For large catalogs we scan an 8-bit
+copy instead (4x fewer bytes), keep the best RERANK_CANDIDATES, and re-score
+just those with the exact float32 vectors - so the final order is exact.
+Below QUANTIZE_MIN_VECTORS the whole index fits in cache and the plain flat
+scan is already faster. (FAISS only - numpy can't do int8 math without
+converting back to float, which would cost more than it saves.)
+
+Chroma stays our persistent store: the index is loaded from the vectors,
+documents and metadata Chroma already holds.
+"""
+
+from typing import Callable
+
+import numpy as np
+
+# FAISS is optional - numpy gives identical results, just a bit slower
+try:
+    import faiss
+except ImportError:
+    faiss = None
+
+
+# Use an 8-bit scan + exact re-rank from this many recipes up
+QUANTIZE_MIN_VECTORS = 20_000
+
+# How many 8-bit results get re-scored with the exact vectors
+RERANK_CANDIDATES = 50
+
+
+def normalize(vectors: np.ndarray) -> np.ndarray:
+    """Scale each row to unit length (in place) and return it."""
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    vectors /= norms
+    return vectors
+
+
+class RecipeVectorIndex:
+    """
+    Exact inner-product search over recipe embeddings, with payloads kept alongside.
+
+    Stored embeddings are normalized on load; query embeddings are
+    expected to be unit length already.
+    """
+
+    def __init__(
+        self,
+        ids: list[int],
+        embeddings,
+        documents: list[str],
+        metadatas: list[dict],
+    ):
+        self.ids = ids
+        self.documents = documents
+        self.metadatas = metadatas
+
+        # CONCEPT: Tag Bitmasks
+        # Each dietary tag gets one bit; each recipe's tags become one int.
+        # "Has any of these tags?" is then a single AND per recipe instead of
+        # splitting its tag string and comparing every tag on every search.
+        self.tag_bits: dict[str, int] = {}
+        self.dietary_masks: list[int] = []
+        for metadata in metadatas:
+            mask = 0
+            for tag in metadata.get("dietary_tags", "").split(","):
+                if tag:
+                    mask |= self.tag_bits.setdefault(tag, 1 << len(self.tag_bits))
+            self.dietary_masks.append(mask)
+
+        self._quantized = False
+        
+        if not ids:
+            self.dimension = 0
+            return
+
+        vectors = np.ascontiguousarray(embeddings, dtype=np.float32).reshape(len(ids), -1)
+        self.dimension = vectors.shape[1]
+        
+        # New embeddings are normalized before they're stored, but a collection
+        # indexed before that may hold raw vectors - normalizing again is a
+        # no-op for unit vectors and costs one pass at load time, never per query
+        normalize(vectors)
+
+        if faiss is not None and len(ids) >= QUANTIZE_MIN_VECTORS:
+            self._index = faiss.IndexScalarQuantizer(
+                self.dimension, faiss.ScalarQuantizer.QT_8bit, faiss.METRIC_INNER_PRODUCT
+            )
+            # "Training" learns each dimension's range for the 8-bit encoding
+            self._index.train(vectors)
+            self._index.add(vectors)
+            self._vectors = vectors  # kept for exact re-ranking
+            self._quantized = True
+        elif faiss is not None:
+            self._index = faiss.IndexFlatIP(self.dimension)
+            self._index.add(vectors)
+        else:
+            self._vectors = vectors
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def _scores(self, query: np.ndarray, k: int) -> tuple[np.ndarray, np.ndarray]:
+        """Return (similarities, positions) of the top-k vectors, best first."""
+        if self._quantized and k >= len(self.ids):
+            # Ranking everything (a filtered search) - an 8-bit pre-pass would
+            # only re-score every vector anyway, so go straight to the exact scan
+            similarities = self._vectors @ query
+            positions = np.argsort(-similarities)
+            return similarities[positions], positions
+
+        if self._quantized:
+            candidates = min(len(self.ids), max(k, RERANK_CANDIDATES))
+            _, positions = self._index.search(query[None, :], candidates)
+            positions = positions[0][positions[0] >= 0]
+            similarities = self._vectors[positions] @ query
+            order = np.argsort(-similarities)[:k]
+            return similarities[order], positions[order]
+        
+        if faiss is not None:
+            similarities, positions = self._index.search(query[None, :], k)
+            return similarities[0], positions[0]
+
+        similarities = self._vectors @ query
+
+        # CONCEPT: Partial sort
+        # argpartition finds the top k in O(n); only those k get fully sorted
+        if k < len(similarities):
+            top = np.argpartition(-similarities, k - 1)[:k]
+        else:
+            top = np.arange(len(similarities))
+        positions = top[np.argsort(-similarities[top])]
+        return similarities[positions], positions
+
+    def search(
+        self,
+        query_embedding: list[float],
+        n_results: int = 5,
+        where: Callable[[dict], bool] | None = None,
+        dietary_filter: list[str] | None = None,
+    ) -> list[dict]:
+        """
+        Find the stored recipes most similar to the query embedding.
+
+        Args:
+            query_embedding: Embedding of the search text
+            n_results: How many results to return
+            where: Optional metadata predicate; non-matching recipes are skipped
+            dietary_filter: Optional tags; only recipes with at least one are kept
+
+        Returns:
+            List of {"id", "document", "metadata", "distance"} dicts,
+            where distance is cosine distance (0 = identical)
+        """
+        if not self.ids:
+            return []
+
+        dietary_mask = 0
+        if dietary_filter:
+            for tag in dietary_filter:
+                dietary_mask |= self.tag_bits.get(tag, 0)
+            if not dietary_mask:
+                return []  # No recipe has any of these tags
+
+        query = np.asarray(query_embedding, dtype=np.float32)
+
+        # With a filter we rank everything and keep the first matches -
+        # cheap at recipe scale, and never "top-k then filter to nothing"
+        filtered = where is not None or dietary_mask
+        k = len(self.ids) if filtered else min(n_results, len(self.ids))
+        similarities, positions = self._scores(query, k)
+
+        if not filtered:
+            # Common case: no per-result checks; tolist() gives plain floats/ints
+            return [
+                {
+                    "id": self.ids[position],
+                    "document": self.documents[position],
+                    "metadata": self.metadatas[position],
+                    "distance": 1.0 - similarity,
+                }
+                for similarity, position in zip(similarities.tolist(), positions.tolist())
+                if position >= 0
+            ]
+
+        results = []
+        for similarity, position in zip(similarities, positions):
+            if position < 0:
+                continue
+            if dietary_mask and not self.dietary_masks[position] & dietary_mask:
+                continue
+            metadata = self.metadatas[position]
+            if where and not where(metadata):
+                continue
+            results.append({
+                "id": self.ids[position],
+                "document": self.documents[position],
+                "metadata": metadata,
+                "distance": float(1.0 - similarity),
+            })
+            if len(results) >= n_results:
+                break
+
+        return results
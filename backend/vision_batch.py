@@ -0,0 +1,189 @@
+"""
+📦 Vision Batch - Offline Fridge Scans with the OpenAI Batch API
+
+CONCEPT: Batch API
+
+Interactive scans need an answer in seconds. Bulk jobs (importing a photo
+library, re-analyzing old scans with a new prompt) don't - and for those
+OpenAI's Batch API charges about half price and has separate, much higher
+rate limits. The trade-off: results arrive within 24 hours, not seconds.
+
+The flow:
+1. Write one JSONL line per image - the same request analyze_image_for_ingredients
+   would send (see vision_service.scan_request)
+2. Upload the file and create the batch
+3. Poll until it finishes, download the output file, match lines by custom_id
+
+One batch holds at most 50,000 requests and a 200MB input file, so large
+jobs are split into several batches that run side by side.
+
+Run this script with: python vision_batch.py photo1.jpg photo2.jpg ...
+(or a directory of photos)
+"""
+
+import io
+import time
+from pathlib import Path
+from typing import Iterable, Iterator
+
+import orjson
+from openai import OpenAI
+
+from config import settings
+import vision_service
+
+
+client = OpenAI(api_key=settings.OPENAI_API_KEY)
+
+IMAGE_SUFFIXES = {".jpg", ".jpeg", ".png", ".webp"}
+
+# Batch jobs can take hours - no point asking more often than this
+POLL_SECONDS = 60
+
+FINISHED_STATUSES = {"completed", "failed", "expired", "cancelled"}
+
+# Batch API limits per batch: 50,000 requests and a 200MB input file.
+# The byte cap is kept well under the limit so the file never gets close.
+MAX_BATCH_REQUESTS = 50_000
+MAX_BATCH_FILE_BYTES = 150 * 1024 * 1024
+
+
+def build_batch_files(
+    images: Iterable[tuple[str, bytes]], detail: str = "high"
+) -> Iterator[tuple[bytes, int]]:
+    """
+    Build the JSONL input for one or more batches: one scan request per image.
+    
+    Args:
+        images: (custom_id, raw image bytes) pairs - custom_ids must be unique
+        detail: Vision detail level for every image
+    
+    Yields:
+        (JSONL file contents, number of requests in it), each within the
+        per-batch request and size limits
+    """
+    max_edge = vision_service.MAX_EDGE_FOR_DETAIL.get(detail, vision_service.DETAILED_MAX_EDGE)
+    lines, size = [], 0
+    for custom_id, image_bytes in images:
+        image_base64 = vision_service.encode_image(image_bytes, max_edge)
+        line = orjson.dumps({
+            "custom_id": custom_id,
+            "method": "POST",
+            "url": "/v1/chat/completions",
+            "body": vision_service.scan_request(vision_service.VISION_MODEL, image_base64, detail),
+        })
+        if lines and (len(lines) == MAX_BATCH_REQUESTS or size + len(line) + 1 > MAX_BATCH_FILE_BYTES):
+            yield b"\n".join(lines), len(lines)
+            lines, size = [], 0
+        lines.append(line)
+        size += len(line) + 1
+    if lines:
+        yield b"\n".join(lines), len(lines)
+
+
+def submit_batch(batch_file: bytes, request_count: int) -> str:
+    """Upload one JSONL input file and start a batch. Returns the batch id."""
+    uploaded = client.files.create(
+        file=("vision_batch.jsonl", io.BytesIO(batch_file)),
+        purpose="batch",
+    )
+    batch = client.batches.create(
+        input_file_id=uploaded.id,
+        endpoint="/v1/chat/completions",
+        completion_window="24h",
+    )
+    print(f"[VisionBatch] Submitted {request_count} images as batch {batch.id}")
+    return batch.id
+
+
+def wait_for_batch(batch_id: str, poll_seconds: float = POLL_SECONDS):
+    """Poll until the batch reaches a final status, then return it."""
+    while True:
+        batch = client.batches.retrieve(batch_id)
+        if batch.status in FINISHED_STATUSES:
+            return batch
+        counts = batch.request_counts
+        print(f"[VisionBatch] {batch.status}: {counts.completed}/{counts.total} done")
+        time.sleep(poll_seconds)
+
+
+def fetch_results(batch) -> dict[str, dict]:
+    """
+    Download a finished batch's output.
+
+    Returns:
+        custom_id -> result dict, in the same shape as
+        analyze_image_for_ingredients ({"success", "data"} or {"success", "error"})
+    """
+    results = {}
+    for file_id in (batch.output_file_id, batch.error_file_id):
+        if not file_id:
+            continue
+        for line in client.files.content(file_id).content.splitlines():
+            if line.strip():
+                record = orjson.loads(line)
+                results[record["custom_id"]] = _parse_result(record)
+    return results
+
+
+def _parse_result(record: dict) -> dict:
+    """Turn one output line into a scan result."""
+    response = record.get("response") or {}
+    if record.get("error") or response.get("status_code") != 200:
+        error = record.get("error") or response.get("body", {}).get("error")
+        return {"success": False, "error": str(error)}
+
+    body = response["body"]
+    try:
+        data = orjson.loads(body["choices"][0]["message"]["content"])
+    except orjson.JSONDecodeError as e:
+        return {"success": False, "error": f"Failed to parse response: {str(e)}"}
+
+    return {
+        "success": True,
+        "data": data,
+        "model": body.get("model"),
+        "usage": body.get("usage"),
+    }
+
+
+def scan_images(paths: list[Path], detail: str = "high") -> dict[Path, dict]:
+    """Submit every image, wait for the batches, and return results by path."""
+    # Index-based ids: two photos can share a file name in different folders
+    paths_by_id = {f"image-{index}": path for index, path in enumerate(paths)}
+    images = ((custom_id, path.read_bytes()) for custom_id, path in paths_by_id.items())
+    
+    # Submit everything first so the batches run concurrently, then collect
+    batch_ids = [submit_batch(batch_file, count) for batch_file, count in build_batch_files(images, detail)]
+    
+    results = {}
+    for batch_id in batch_ids:
+        batch = wait_for_batch(batch_id)
+        if batch.status != "completed":
+            print(f"[VisionBatch] Batch {batch.id} ended as {batch.status}")
+        for custom_id, result in fetch_results(batch).items():
+            results[paths_by_id[custom_id]] = result
+    return results
+
+
+if __name__ == "__main__":
+    import sys
+
+    paths = []
+    for arg in sys.argv[1:]:
+        path = Path(arg)
+        if path.is_dir():
+            paths.extend(sorted(p for p in path.iterdir() if p.suffix.lower() in IMAGE_SUFFIXES))
+        else:
+            paths.append(path)
+
+    if not paths:
+        print("Usage: python vision_batch.py <image or directory> ...")
+        sys.exit(1)
+
+    for path, result in scan_images(paths).items():
+        if result["success"]:
+            names = vision_service.get_simple_ingredient_list(result)
+            print(f"{path}: {len(names)} items - {', '.join(names)}")
+        else:
+            print(f"{path}: failed - {result['error']}")
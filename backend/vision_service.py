@@ -14,123 +14,224 @@ Supports two modes:
 - DETAILED: Uses GPT-4o with high detail (~8-12 seconds)
 """
 
-import base64
-import json
+import asyncio
+import orjson
 import io
-from openai import OpenAI
-from config import settings
+from typing import Iterator, Literal
+from PIL import Image
+from pydantic import BaseModel, ConfigDict, Field
+import cpu_pool
+from cpu_pool import base64
+from openai_client import async_client
 
-# Initialize OpenAI client
-client = OpenAI(api_key=settings.OPENAI_API_KEY)
+# Models per mode. They are also part of the result cache keys (see main.py),
+# so switching models never serves answers cached from the old one.
+VISION_MODEL = "gpt-4o"          # GPT-4o has vision capabilities
+FAST_VISION_MODEL = "gpt-4o-mini"  # Faster model
+
+
+# CONCEPT: Bounded Fan-Out
+# Vision calls go through the shared async client, so several can be in
+# flight at once (see analyze_image_multipass). A semaphore caps how many
+# run concurrently - a burst of uploads shouldn't hit OpenAI's rate limits.
+MAX_CONCURRENT_VISION_CALLS = 5
+_vision_slots = asyncio.Semaphore(MAX_CONCURRENT_VISION_CALLS)
+
+
+async def _vision_completion(**kwargs):
+    """One chat completion, waiting for a free vision slot first."""
+    async with _vision_slots:
+        return await async_client.chat.completions.create(**kwargs)
+
+
+# ============================================================================
+# Image Preprocessing
+# ============================================================================
+# Phone photos are often 4000x3000 and several MB. GPT-4 Vision downsamples
+# large images anyway and bills per 512px tile, so sending the full image
+# just wastes upload time and tokens.
+
+FAST_MAX_EDGE = 512       # Low detail sees a single 512px image anyway
+DETAILED_MAX_EDGE = 2048  # Keep more pixels so small items are still visible
+
+# Longest edge worth sending for each vision "detail" setting
+MAX_EDGE_FOR_DETAIL = {"low": FAST_MAX_EDGE, "high": DETAILED_MAX_EDGE, "auto": DETAILED_MAX_EDGE}
+
+
+def downscale_image(image_bytes: bytes, max_edge: int, quality: int = 85) -> bytes:
+    """
+    Shrink an image so its longest edge is at most `max_edge` pixels.
+    
+    Images that are already small enough are returned untouched. Anything
+    Pillow can't decode is passed through so OpenAI can report the error.
+    
+    Returns:
+        JPEG bytes (or the original bytes if no resize was needed)
+    """
+    try:
+        img = Image.open(io.BytesIO(image_bytes))
+        if max(img.size) <= max_edge:
+            return image_bytes
+        
+        img.thumbnail((max_edge, max_edge), Image.Resampling.LANCZOS)
+        out = io.BytesIO()
+        img.convert("RGB").save(out, format="JPEG", quality=quality)
+        return out.getvalue()
+    except Exception as e:
+        print(f"[Vision] Could not downscale image: {e}")
+        return image_bytes
+
+
+def encode_image(image_bytes: bytes, max_edge: int | None = None, quality: int = 85) -> str:
+    """
+    Optionally downscale an image, then base64-encode it for a data URL.
+    
+    Both steps are CPU work on potentially megabytes of data, so callers
+    run this on the CPU pool (cpu_pool.run) off the event loop.
+    """
+    if max_edge:
+        image_bytes = downscale_image(image_bytes, max_edge, quality)
+    return base64.b64encode(image_bytes).decode('ascii')
+
+
+def shrink_base64_image(image_base64: str, max_edge: int, quality: int = 85) -> str:
+    """
+    Downscale an already base64-encoded image.
+    
+    If it's already small enough (or can't be decoded) the original string
+    is returned as-is - no pointless re-encode. Run via cpu_pool.run.
+    """
+    try:
+        raw = base64.b64decode(image_base64)
+    except ValueError:
+        return image_base64
+    
+    smaller = downscale_image(raw, max_edge, quality)
+    if smaller is raw:
+        return image_base64
+    return base64.b64encode(smaller).decode('ascii')
+
+
+def strip_data_url(image_base64: str) -> str:
+    """Drop a "data:image/...;base64," prefix, if present."""
+    if image_base64.startswith('data:'):
+        return image_base64.split(',', 1)[-1]
+    return image_base64
+
+
+async def prepare_image(image_data: str | bytes, is_base64: bool, max_edge: int) -> str:
+    """
+    Turn raw bytes, base64 or a data URL into downscaled base64 for the API.
+    
+    Uploads and base64 payloads from the frontend both get shrunk - the
+    tile count (and so the prompt tokens) depends on the pixels we send.
+    """
+    if not is_base64 and isinstance(image_data, bytes):
+        return await cpu_pool.run(encode_image, image_data, max_edge)
+    
+    return await cpu_pool.run(shrink_base64_image, strip_data_url(image_data), max_edge)
+
+
+# ============================================================================
+# Response Schemas
+# ============================================================================
+# CONCEPT: Structured Outputs
+# Instead of describing the JSON shape in the prompt (tokens on every call)
+# and hoping the model follows it, we hand OpenAI a JSON Schema in strict
+# mode. The response is guaranteed to match it, so there's nothing to
+# re-describe and no malformed JSON to recover from.
+#
+# Strict mode requires every field and forbids extra ones - hence
+# extra="forbid" and no defaults below.
+
+class _StrictModel(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
+
+class DetectedIngredient(_StrictModel):
+    name: str
+    quantity: str = Field(description="Estimated amount")
+    location: str = Field(description="Where in the image")
+    condition: str = Field(description="fresh, frozen, leftover, ...")
+    category: Literal["protein", "dairy", "vegetable", "fruit", "condiment", "pantry", "beverage", "prepared", "other"]
+
+
+class IngredientInventory(_StrictModel):
+    ingredients: list[DetectedIngredient]
+    total_count: int
+    areas_checked: list[str]
+    summary: str
+    meal_potential: str = Field(description="Meals these ingredients could make")
+    notes: str = Field(description="Items that were hard to identify or partially visible")
+
+
+class QuickIngredient(_StrictModel):
+    name: str
+    quantity: str = Field(description="Amount if visible, else empty")
+
+
+class QuickInventory(_StrictModel):
+    ingredients: list[QuickIngredient]
+    summary: str
+
+
+class SlimInventory(_StrictModel):
+    ingredients: list[str] = Field(description="Ingredient names only")
+    summary: str
+
+
+def json_schema_format(name: str, model: type[BaseModel]) -> dict:
+    """response_format for a strict JSON Schema built from a Pydantic model."""
+    return {
+        "type": "json_schema",
+        "json_schema": {"name": name, "strict": True, "schema": model.model_json_schema()},
+    }
+
+
+class InventoryBatch(_StrictModel):
+    images: list[IngredientInventory] = Field(description="One inventory per image, in order")
+
+
+INVENTORY_FORMAT = json_schema_format("ingredient_inventory", IngredientInventory)
+INVENTORY_BATCH_FORMAT = json_schema_format("ingredient_inventory_batch", InventoryBatch)
+QUICK_INVENTORY_FORMAT = json_schema_format("quick_inventory", QuickInventory)
+SLIM_INVENTORY_FORMAT = json_schema_format("slim_inventory", SlimInventory)
 
 
 # ============================================================================
 # FAST MODE - Optimized for speed (~2-3 seconds)
 # ============================================================================
 
-FAST_DETECTION_PROMPT = """Identify ALL food items in this image. Return JSON:
-{
-  "ingredients": [{"name": "item", "quantity": "amount if visible"}],
-  "summary": "brief description"
-}
+FAST_DETECTION_PROMPT = """Identify ALL food items in this image.
 
 Be thorough - check shelves, drawers, door, counters. Include condiments, produce, dairy, meats, beverages."""
 
 
 # Enhanced system prompt for thorough ingredient detection
-INGREDIENT_DETECTION_PROMPT = """You are a professional chef and food inventory specialist with exceptional attention to detail. Your task is to EXHAUSTIVELY identify EVERY food item and ingredient visible in the image.
-
-## CRITICAL INSTRUCTIONS:
-1. Scan the ENTIRE image systematically - top to bottom, left to right
-2. Look in ALL areas: shelves, drawers, door compartments, corners, behind other items
-3. Identify items even if partially visible or obscured
-4. Include EVERYTHING edible, no matter how small or common
-
-## CATEGORIES TO CHECK (be thorough in each):
-
-### PROTEINS:
-- Meats (chicken, beef, pork, turkey, lamb, fish, seafood, deli meats, bacon, sausage)
-- Eggs
-- Tofu, tempeh, seitan
-
-### DAIRY & ALTERNATIVES:
-- Milk, cream, half-and-half
-- Cheese (all types - shredded, sliced, blocks, cream cheese)
-- Yogurt, sour cream, cottage cheese
-- Butter, margarine
-- Plant-based alternatives
-
-### PRODUCE - VEGETABLES:
-- Leafy greens (lettuce, spinach, kale, cabbage, arugula)
-- Root vegetables (carrots, potatoes, onions, garlic, ginger, beets, radishes)
-- Cruciferous (broccoli, cauliflower, brussels sprouts)
-- Nightshades (tomatoes, peppers, eggplant)
-- Squash family (zucchini, cucumber, pumpkin)
-- Alliums (onions, garlic, shallots, leeks, scallions)
-- Others (celery, asparagus, corn, peas, beans, mushrooms)
-
-### PRODUCE - FRUITS:
-- Citrus (lemons, limes, oranges, grapefruit)
-- Berries (strawberries, blueberries, raspberries)
-- Stone fruits (peaches, plums, cherries)
-- Tropical (bananas, mangoes, pineapple, avocados)
-- Apples, pears, grapes
-- Melons
-
-### CONDIMENTS & SAUCES:
-- Ketchup, mustard, mayonnaise, hot sauce
-- Soy sauce, fish sauce, oyster sauce
-- Salad dressings, marinades
-- Jams, jellies, honey, maple syrup
-- Peanut butter, nut butters, Nutella
-- Pickles, olives, capers, relish
-
-### BEVERAGES:
-- Juices, sodas, water
-- Wine, beer
-- Coffee, tea
-
-### PANTRY ITEMS (if visible):
-- Bread, tortillas, wraps
-- Grains (rice, pasta, oats)
-- Canned goods (beans, tomatoes, soups)
-- Oils, vinegars
-- Spices and seasonings
-- Flour, sugar, baking items
-- Nuts, seeds
-- Snacks, crackers, chips
-
-### PREPARED/LEFTOVER FOODS:
-- Takeout containers
-- Meal prep containers
-- Leftovers in storage containers
-
-## OUTPUT FORMAT:
-Return a JSON object with this structure:
-{
-    "ingredients": [
-        {"name": "ingredient name", "quantity": "estimated amount", "location": "where in image", "condition": "fresh/frozen/leftover/etc", "category": "protein/dairy/vegetable/fruit/condiment/pantry/beverage/prepared"}
-    ],
-    "total_count": <number of items found>,
-    "areas_checked": ["door shelves", "main shelves", "drawers", "etc"],
-    "summary": "Brief description of what's available",
-    "meal_potential": "What meals could be made with these ingredients",
-    "notes": "Any items that were hard to identify or partially visible"
-}
-
-## IMPORTANT:
-- Be THOROUGH - it's better to list too many items than miss any
-- Include common staples even if they seem obvious (butter, eggs, milk)
-- If you see a container but can't identify contents, note it as "unidentified container"
-- Describe partially visible items as best you can
-- List each distinct item separately (don't group)
+INGREDIENT_DETECTION_PROMPT = """You are a chef taking a complete food inventory from a photo. List EVERY edible item visible.
+
+Scan the whole image top to bottom, left to right: shelves, door, drawers, corners, behind other items. Include partially visible items and obvious staples (butter, eggs, milk). List each distinct item separately.
+Check: proteins, eggs, dairy and alternatives, vegetables, fruits, herbs, condiments and sauces, spreads, pickles, beverages, bread, grains, canned goods, oils, spices, baking items, nuts, snacks, leftovers and takeout.
+Unreadable containers: "unidentified container".
 """
 
+# User message for the standard (single pass) scan
+INGREDIENT_SCAN_REQUEST = "List every food item and ingredient in this image. Read labels where visible; include uncertain items with a note."
+
+
+# CONCEPT: Model Routing
+# Most photos (a few clearly visible items) are handled fine by gpt-4o-mini
+# at a fraction of gpt-4o's cost and latency. We try the small model first
+# and only escalate when its answer looks too thin to trust.
+SCAN_MODEL_CHAIN = (FAST_VISION_MODEL, VISION_MODEL)
+ESCALATE_BELOW_INGREDIENTS = 3
+
 
 async def analyze_image_for_ingredients(
     image_data: str | bytes,
     is_base64: bool = True,
-    detail: str = "high"
+    detail: str = "high",
+    complexity: str = "auto"
 ) -> dict:
     """
     Analyze an image to detect food ingredients with maximum thoroughness.
@@ -139,73 +240,82 @@ async def analyze_image_for_ingredients(
         image_data: Either base64 encoded string or raw bytes
         is_base64: Whether image_data is already base64 encoded
         detail: "low", "high", or "auto" - affects token usage and accuracy
+        complexity: "auto" tries gpt-4o-mini first and escalates to gpt-4o
+                    if it fails or finds fewer than 3 items; "high" goes
+                    straight to gpt-4o
     
     Returns:
         Dictionary with detected ingredients and suggestions
     """
     
-    # Convert bytes to base64 if needed
-    if not is_base64 and isinstance(image_data, bytes):
-        image_data = base64.b64encode(image_data).decode('utf-8')
+    # Shrink to what the requested detail level can actually use
+    image_data = await prepare_image(
+        image_data, is_base64, MAX_EDGE_FOR_DETAIL.get(detail, DETAILED_MAX_EDGE)
+    )
     
-    # Clean base64 string (remove data URL prefix if present)
-    if isinstance(image_data, str) and image_data.startswith('data:'):
-        image_data = image_data.split(',')[1]
+    models = SCAN_MODEL_CHAIN if complexity == "auto" else (VISION_MODEL,)
+    for model in models:
+        result = await _scan_inventory(model, image_data, detail)
+        if result["success"] and len(result["data"]["ingredients"]) >= ESCALATE_BELOW_INGREDIENTS:
+            break
+    return result
+
+
+def scan_request(model: str, image_data: str, detail: str) -> dict:
+    """
+    Chat completion arguments for one comprehensive scan of a base64 image.
     
-    try:
-        # First pass - comprehensive scan
-        response = client.chat.completions.create(
-            model="gpt-4o",  # GPT-4o has vision capabilities
-            messages=[
-                {
-                    "role": "system",
-                    "content": INGREDIENT_DETECTION_PROMPT
-                },
-                {
-                    "role": "user",
-                    "content": [
-                        {
-                            "type": "text",
-                            "text": """Please analyze this image VERY CAREFULLY and list EVERY food item and ingredient you can see.
-
-Take your time and scan:
-1. Every shelf from top to bottom
-2. Door compartments and side shelves
-3. Drawers (vegetable/fruit crispers)
-4. Any items in the back or corners
-5. Items that may be partially hidden
-
-Don't skip anything - even common items like butter, eggs, or condiments should be listed.
-Look for labels on containers and packages to identify contents.
-If something looks like food but you're not 100% sure, include it with a note."""
-                        },
-                        {
-                            "type": "image_url",
-                            "image_url": {
-                                "url": f"data:image/jpeg;base64,{image_data}",
-                                "detail": detail
-                            }
+    Shared by the online scan and the offline Batch API (vision_batch.py),
+    so both ask exactly the same question.
+    """
+    return {
+        "model": model,
+        "messages": [
+            {
+                "role": "system",
+                "content": INGREDIENT_DETECTION_PROMPT
+            },
+            {
+                "role": "user",
+                "content": [
+                    {
+                        "type": "text",
+                        "text": INGREDIENT_SCAN_REQUEST
+                    },
+                    {
+                        "type": "image_url",
+                        "image_url": {
+                            "url": f"data:image/jpeg;base64,{image_data}",
+                            "detail": detail
                         }
-                    ]
-                }
-            ],
-            response_format={"type": "json_object"},
-            max_tokens=4000,  # Increased for comprehensive listing
-            temperature=0.2,  # Lower temperature for more consistent detection
-        )
+                    }
+                ]
+            }
+        ],
+        "response_format": INVENTORY_FORMAT,
+        "max_tokens": 4000,  # Increased for comprehensive listing
+        "temperature": 0.2,  # Lower temperature for more consistent detection
+    }
+
+
+async def _scan_inventory(model: str, image_data: str, detail: str) -> dict:
+    """One comprehensive scan of a base64 image with the given model."""
+    try:
+        response = await _vision_completion(**scan_request(model, image_data, detail))
         
-        result = json.loads(response.choices[0].message.content)
+        result = orjson.loads(response.choices[0].message.content)
         
         return {
             "success": True,
             "data": result,
+            "model": model,
             "usage": {
                 "prompt_tokens": response.usage.prompt_tokens,
                 "completion_tokens": response.usage.completion_tokens,
             }
         }
         
-    except json.JSONDecodeError as e:
+    except orjson.JSONDecodeError as e:
         return {
             "success": False,
             "error": f"Failed to parse response: {str(e)}",
@@ -217,9 +327,72 @@ If something looks like food but you're not 100% sure, include it with a note.""
         }
 
 
+# Most photos we put into one request
+MAX_BATCH_IMAGES = 10
+
+
+async def analyze_images_batch(images: list[bytes], detail: str = "high") -> list[dict]:
+    """
+    Scan several photos (e.g. each fridge shelf) in ONE vision call.
+    
+    CONCEPT: Request Batching
+    Every call pays a round trip plus the system prompt. Sending the images
+    together pays for both once, instead of once per photo.
+    
+    Args:
+        images: Raw image bytes, at most MAX_BATCH_IMAGES
+        detail: Vision detail level for every image
+    
+    Returns:
+        One result dict per image, in order (same shape as
+        analyze_image_for_ingredients)
+    """
+    max_edge = MAX_EDGE_FOR_DETAIL.get(detail, DETAILED_MAX_EDGE)
+    encoded = await asyncio.gather(*(
+        prepare_image(image, False, max_edge) for image in images
+    ))
+    
+    content = [{
+        "type": "text",
+        "text": f"{len(images)} photos follow, labelled IMG_1 to IMG_{len(images)}. "
+                f"{INGREDIENT_SCAN_REQUEST} Return one inventory per photo, in order."
+    }]
+    for number, image_base64 in enumerate(encoded, start=1):
+        content.append({"type": "text", "text": f"IMG_{number}"})
+        content.append({
+            "type": "image_url",
+            "image_url": {
+                "url": f"data:image/jpeg;base64,{image_base64}",
+                "detail": detail
+            }
+        })
+    
+    try:
+        response = await _vision_completion(
+            model=VISION_MODEL,
+            messages=[
+                {"role": "system", "content": INGREDIENT_DETECTION_PROMPT},
+                {"role": "user", "content": content},
+            ],
+            response_format=INVENTORY_BATCH_FORMAT,
+            max_tokens=min(16000, 4000 * len(images)),
+            temperature=0.2,
+        )
+        inventories = orjson.loads(response.choices[0].message.content)["images"]
+    except Exception as e:
+        return [{"success": False, "error": str(e)} for _ in images]
+    
+    if len(inventories) != len(images):
+        error = f"Expected {len(images)} inventories, got {len(inventories)}"
+        return [{"success": False, "error": error} for _ in images]
+    
+    return [{"success": True, "data": inventory} for inventory in inventories]
+
+
 async def analyze_image_fast(
     image_data: str | bytes,
     is_base64: bool = True,
+    slim: bool = True,
 ) -> dict:
     """
     FAST image analysis using GPT-4o-mini with low detail.
@@ -230,22 +403,19 @@ async def analyze_image_fast(
     Args:
         image_data: Either base64 encoded string or raw bytes
         is_base64: Whether image_data is already base64 encoded
+        slim: Ask for names only - callers mostly use just the names, and
+              skipping quantities roughly halves the tokens generated
     
     Returns:
         Dictionary with detected ingredients
     """
     
-    # Convert bytes to base64 if needed
-    if not is_base64 and isinstance(image_data, bytes):
-        image_data = base64.b64encode(image_data).decode('utf-8')
-    
-    # Clean base64 string (remove data URL prefix if present)
-    if isinstance(image_data, str) and image_data.startswith('data:'):
-        image_data = image_data.split(',')[1]
+    # One 512px image is all low detail looks at
+    image_data = await prepare_image(image_data, is_base64, FAST_MAX_EDGE)
     
     try:
-        response = client.chat.completions.create(
-            model="gpt-4o-mini",  # Faster model
+        response = await _vision_completion(
+            model=FAST_VISION_MODEL,
             messages=[
                 {
                     "role": "user",
@@ -264,15 +434,18 @@ async def analyze_image_fast(
                     ]
                 }
             ],
-            response_format={"type": "json_object"},
+            response_format=SLIM_INVENTORY_FORMAT if slim else QUICK_INVENTORY_FORMAT,
             max_tokens=1000,  # Smaller response for speed
             temperature=0.1,
         )
         
-        result = json.loads(response.choices[0].message.content)
+        result = orjson.loads(response.choices[0].message.content)
         
-        # Normalize the response format
-        ingredients = result.get("ingredients", [])
+        # Normalize the response format (slim names become {"name": ...})
+        ingredients = [
+            {"name": ing} if isinstance(ing, str) else ing
+            for ing in result.get("ingredients", [])
+        ]
         ingredient_names = [
             ing.get("name", ing) if isinstance(ing, dict) else str(ing) 
             for ing in ingredients
@@ -291,7 +464,7 @@ async def analyze_image_fast(
             }
         }
         
-    except json.JSONDecodeError as e:
+    except orjson.JSONDecodeError as e:
         return {
             "success": False,
             "error": f"Failed to parse response: {str(e)}",
@@ -317,8 +490,8 @@ async def analyze_image_url(image_url: str) -> dict:
     """
     
     try:
-        response = client.chat.completions.create(
-            model="gpt-4o",
+        response = await _vision_completion(
+            model=VISION_MODEL,
             messages=[
                 {
                     "role": "system",
@@ -329,17 +502,7 @@ async def analyze_image_url(image_url: str) -> dict:
                     "content": [
                         {
                             "type": "text",
-                            "text": """Please analyze this image VERY CAREFULLY and list EVERY food item and ingredient you can see.
-
-Scan systematically:
-1. Every shelf from top to bottom
-2. Door compartments and side shelves  
-3. Drawers (vegetable/fruit crispers)
-4. Items in the back or corners
-5. Partially hidden items
-
-Include ALL items - even common staples like butter, eggs, milk, condiments.
-Read labels on containers and packages when visible."""
+                            "text": INGREDIENT_SCAN_REQUEST
                         },
                         {
                             "type": "image_url",
@@ -351,12 +514,12 @@ Read labels on containers and packages when visible."""
                     ]
                 }
             ],
-            response_format={"type": "json_object"},
+            response_format=INVENTORY_FORMAT,
             max_tokens=4000,
             temperature=0.2,
         )
         
-        result = json.loads(response.choices[0].message.content)
+        result = orjson.loads(response.choices[0].message.content)
         
         return {
             "success": True,
@@ -387,20 +550,16 @@ async def analyze_image_detailed(
         Dictionary with comprehensive detected ingredients
     """
     
-    # Convert bytes to base64 if needed
-    if not is_base64 and isinstance(image_data, bytes):
-        image_data = base64.b64encode(image_data).decode('utf-8')
-    
-    if isinstance(image_data, str) and image_data.startswith('data:'):
-        image_data = image_data.split(',')[1]
+    # Shrink very large photos (small items still need the pixels)
+    image_data = await prepare_image(image_data, is_base64, DETAILED_MAX_EDGE)
     
     focus_instruction = ""
     if focus_areas:
         focus_instruction = f"\n\nPay EXTRA attention to these areas: {', '.join(focus_areas)}"
     
     try:
-        response = client.chat.completions.create(
-            model="gpt-4o",
+        response = await _vision_completion(
+            model=VISION_MODEL,
             messages=[
                 {
                     "role": "system",
@@ -411,21 +570,7 @@ async def analyze_image_detailed(
                     "content": [
                         {
                             "type": "text",
-                            "text": f"""DETAILED INGREDIENT SCAN REQUEST
-
-Please perform an EXHAUSTIVE scan of this image. I need you to identify EVERY SINGLE food item visible.
-
-SCANNING PROTOCOL:
-1. Start at the TOP LEFT corner and scan across
-2. Move down row by row
-3. Check BEHIND visible items for hidden foods
-4. Look at ALL door shelves and compartments
-5. Examine drawer contents carefully
-6. Read ALL visible labels and packaging
-7. Note items in containers (even if you have to guess contents)
-8. Include condiment bottles, sauce jars, everything
-
-Do NOT skip common items. If you see butter, list it. If you see eggs, list them. Every single edible item matters.{focus_instruction}"""
+                            "text": f"""EXHAUSTIVE scan: go row by row from the top left, look behind items and inside every door shelf and drawer, read all labels, and guess the contents of containers. Every edible item counts, common ones included.{focus_instruction}"""
                         },
                         {
                             "type": "image_url",
@@ -437,12 +582,12 @@ Do NOT skip common items. If you see butter, list it. If you see eggs, list them
                     ]
                 }
             ],
-            response_format={"type": "json_object"},
+            response_format=INVENTORY_FORMAT,
             max_tokens=4000,
             temperature=0.1,  # Very low for maximum accuracy
         )
         
-        result = json.loads(response.choices[0].message.content)
+        result = orjson.loads(response.choices[0].message.content)
         
         return {
             "success": True,
@@ -460,33 +605,87 @@ Do NOT skip common items. If you see butter, list it. If you see eggs, list them
         }
 
 
-def get_simple_ingredient_list(vision_result: dict) -> list[str]:
+async def analyze_image_multipass(
+    image_data: str | bytes,
+    is_base64: bool = True,
+    focus_areas: list[str] = None
+) -> dict:
     """
-    Extract just the ingredient names from a vision result.
+    Run the fast and detailed scans at the same time and merge what they find.
     
-    Args:
-        vision_result: The result from analyze_image_for_ingredients
+    The two passes are independent, so together they take about as long as
+    the slower one. The fast pass (a different model at low detail) often
+    catches items the detailed pass skipped, and vice versa.
     
     Returns:
-        List of ingredient names (strings)
+        Same shape as analyze_image_detailed, with the merged ingredient list
     """
-    if not vision_result.get("success"):
-        return []
+    # Encode once; the fast pass shrinks this further to its own size
+    image_data = await prepare_image(image_data, is_base64, DETAILED_MAX_EDGE)
+    
+    fast, detailed = await asyncio.gather(
+        analyze_image_fast(image_data),
+        analyze_image_detailed(image_data, focus_areas=focus_areas),
+    )
+    
+    if not (detailed["success"] or fast["success"]):
+        return detailed
+    
+    data = detailed["data"] if detailed["success"] else {"summary": fast["summary"]}
+    ingredients = list(data.get("ingredients", []))
     
-    data = vision_result.get("data", {})
-    ingredients = data.get("ingredients", [])
+    # Add what only the fast pass saw (matched by lowercased name)
+    if fast["success"]:
+        seen = {name.lower() for name in iter_ingredient_names(detailed)}
+        for ing in fast["ingredients"]:
+            name = ing.get("name", "") if isinstance(ing, dict) else str(ing)
+            if name and name.lower() not in seen:
+                seen.add(name.lower())
+                ingredients.append(ing)
     
-    # Handle both dict and string format for ingredients
-    result = []
-    for ing in ingredients:
+    return {
+        "success": True,
+        "data": {**data, "ingredients": ingredients, "total_count": len(ingredients)},
+        "mode": "multipass",
+    }
+
+
+def iter_ingredients(vision_result: dict) -> Iterator[tuple[str, str | None]]:
+    """
+    Yield (name, category) for each detected ingredient, in one lazy pass.
+    
+    Handles both dict and plain-string ingredients; plain strings have no
+    category (None). Failed results yield nothing.
+    """
+    if not vision_result.get("success"):
+        return
+    
+    for ing in vision_result.get("data", {}).get("ingredients", []):
         if isinstance(ing, dict):
             name = ing.get("name", "")
             if name:
-                result.append(name)
+                yield name, ing.get("category", "other")
         elif isinstance(ing, str):
-            result.append(ing)
+            yield ing, None
+
+
+def iter_ingredient_names(vision_result: dict) -> Iterator[str]:
+    """Yield just the ingredient names from a vision result."""
+    for name, _ in iter_ingredients(vision_result):
+        yield name
+
+
+def get_simple_ingredient_list(vision_result: dict) -> list[str]:
+    """
+    Extract just the ingredient names from a vision result.
     
-    return result
+    Args:
+        vision_result: The result from analyze_image_for_ingredients
+    
+    Returns:
+        List of ingredient names (strings)
+    """
+    return list(iter_ingredient_names(vision_result))
 
 
 def get_ingredients_by_category(vision_result: dict) -> dict[str, list[str]]:
@@ -499,20 +698,24 @@ def get_ingredients_by_category(vision_result: dict) -> dict[str, list[str]]:
     Returns:
         Dictionary mapping category to list of ingredient names
     """
-    if not vision_result.get("success"):
-        return {}
+    return extract_names_and_categories(vision_result)[1]
+
+
+def extract_names_and_categories(vision_result: dict) -> tuple[list[str], dict[str, list[str]]]:
+    """
+    Get the ingredient names AND their category grouping in one pass.
     
-    data = vision_result.get("data", {})
-    ingredients = data.get("ingredients", [])
+    Args:
+        vision_result: The result from analyze_image_for_ingredients
     
+    Returns:
+        (ingredient names, dictionary mapping category to ingredient names)
+    """
+    names = []
     categorized = {}
-    for ing in ingredients:
-        if isinstance(ing, dict):
-            category = ing.get("category", "other")
-            name = ing.get("name", "")
-            if name:
-                if category not in categorized:
-                    categorized[category] = []
-                categorized[category].append(name)
+    for name, category in iter_ingredients(vision_result):
+        names.append(name)
+        if category is not None:
+            categorized.setdefault(category, []).append(name)
     
-    return categorized
+    return names, categorized
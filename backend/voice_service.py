@@ -5,17 +5,32 @@ Enables hands-free cooking assistance using:
 - OpenAI Whisper for speech recognition
 - OpenAI TTS for natural voice responses
 - Conversational AI for interactive cooking guidance
+
+CONCEPT: Speaking While Thinking
+
+The slow way to answer out loud is: wait for the whole LLM reply, then
+wait for the whole reply to be synthesized, then play it. Instead we
+stream the reply and send each finished sentence to TTS right away, so
+the first sentence is already playing while the rest is being written.
 """
 
-import base64
+import asyncio
 import json
 import io
-from openai import OpenAI
+import re
+from typing import AsyncIterator, Awaitable, BinaryIO, Callable
+
 from config import settings
+from conversation import trim_history
+from openai_client import async_client
+import cpu_pool
+from cpu_pool import base64
 import rag_service
 
-# Initialize OpenAI client
-client = OpenAI(api_key=settings.OPENAI_API_KEY)
+# Every call goes through the shared async client (pooled HTTP/2
+# connections, see openai_client.py). A blocking client here would freeze
+# the event loop - and every other user's request - for the whole
+# transcription or synthesis.
 
 
 # =============================================================================
@@ -47,27 +62,35 @@ Remember: You're voice-only, so be clear and don't use bullet points or formatti
 """
 
 
-async def transcribe_audio(audio_data: bytes, audio_format: str = "webm") -> dict:
+async def transcribe_audio(
+    audio_data: bytes | BinaryIO,
+    audio_format: str = "webm",
+    language: str | None = "en"
+) -> dict:
     """
-    Convert speech to text using OpenAI Whisper.
+    Convert speech to text using OpenAI Whisper (or settings.TRANSCRIBE_MODEL).
     
     Args:
-        audio_data: Raw audio bytes
+        audio_data: Raw audio bytes, or a binary file object (e.g. an
+                    upload's spooled file), which is streamed to Whisper
+                    without being read into memory first
         audio_format: Audio format (webm, mp3, wav, etc.)
+        language: ISO-639-1 code of the spoken language. Knowing it up front
+                  skips language detection; None to auto-detect
     
     Returns:
         Dictionary with transcription text
     """
     try:
         # Create a file-like object from bytes
-        audio_file = io.BytesIO(audio_data)
-        audio_file.name = f"audio.{audio_format}"
+        audio_file = io.BytesIO(audio_data) if isinstance(audio_data, bytes) else audio_data
         
-        response = client.audio.transcriptions.create(
-            model="whisper-1",
-            file=audio_file,
+        language_hint = {"language": language} if language else {}
+        response = await async_client.audio.transcriptions.create(
+            model=settings.TRANSCRIBE_MODEL,
+            file=(f"audio.{audio_format}", audio_file),
             response_format="text",
-            language="en",  # Hint for English - improves accuracy
+            **language_hint,
             prompt="This is a cooking assistant. The user might say things like: next step, how much salt, what's the temperature, go back, help me."  # Context prompt for better accuracy
         )
         
@@ -87,9 +110,17 @@ async def transcribe_audio(audio_data: bytes, audio_format: str = "webm") -> dic
         }
 
 
-async def generate_speech(text: str, voice: str = "nova") -> dict:
+# Audio larger than this is base64-encoded in a worker thread
+THREADED_ENCODE_MIN_BYTES = 16 * 1024
+
+
+def _encode_audio(audio_bytes: bytes) -> str:
+    return base64.b64encode(audio_bytes).decode('ascii')
+
+
+async def synthesize_speech(text: str, voice: str = "nova") -> dict:
     """
-    Convert text to speech using OpenAI TTS.
+    Convert text to speech using OpenAI TTS, keeping the raw MP3 bytes.
     
     Args:
         text: Text to convert to speech
@@ -99,10 +130,10 @@ async def generate_speech(text: str, voice: str = "nova") -> dict:
                - echo: Male voice
     
     Returns:
-        Dictionary with base64 encoded audio
+        Dictionary with the MP3 bytes under "audio"
     """
     try:
-        response = client.audio.speech.create(
+        response = await async_client.audio.speech.create(
             model="tts-1",  # Use tts-1-hd for higher quality
             voice=voice,
             input=text,
@@ -110,13 +141,9 @@ async def generate_speech(text: str, voice: str = "nova") -> dict:
             speed=1.0,
         )
         
-        # Get audio bytes and encode to base64
-        audio_bytes = response.content
-        audio_base64 = base64.b64encode(audio_bytes).decode('utf-8')
-        
         return {
             "success": True,
-            "audio_base64": audio_base64,
+            "audio": response.content,
             "format": "mp3",
         }
         
@@ -127,6 +154,105 @@ async def generate_speech(text: str, voice: str = "nova") -> dict:
         }
 
 
+async def encode_speech(result: dict) -> dict:
+    """Turn a synthesize_speech result into the base64 form JSON responses carry."""
+    if not result["success"]:
+        return result
+    
+    # Encode on the CPU pool when the clip is big enough to stall the event loop
+    audio_bytes = result["audio"]
+    if len(audio_bytes) > THREADED_ENCODE_MIN_BYTES:
+        audio_base64 = await cpu_pool.run(_encode_audio, audio_bytes)
+    else:
+        audio_base64 = _encode_audio(audio_bytes)
+    
+    return {
+        "success": True,
+        "audio_base64": audio_base64,
+        "format": result["format"],
+    }
+
+
+async def generate_speech(text: str, voice: str = "nova") -> dict:
+    """
+    Convert text to speech using OpenAI TTS.
+    
+    Returns:
+        Dictionary with base64 encoded audio
+    """
+    return await encode_speech(await synthesize_speech(text, voice))
+
+
+# CONCEPT: Parallel Synthesis
+# TTS time grows with the length of the text. For a finished multi-sentence
+# reply, synthesizing each sentence at the same time and joining the clips
+# (MP3 frames can simply be concatenated) takes about as long as the
+# longest sentence instead of the whole reply.
+
+def split_sentences(text: str) -> list[str]:
+    """Split text into sentences at the same boundaries as LazyTextBuffer (SENTENCE_END)."""
+    sentences, start = [], 0
+    for match in SENTENCE_END.finditer(text):
+        sentences.append(text[start:match.end()].strip())
+        start = match.end()
+    sentences.append(text[start:].strip())
+    return [sentence for sentence in sentences if sentence]
+
+
+async def speak_sentences(
+    text: str,
+    speak: Callable[[str], Awaitable[dict]] = synthesize_speech,
+) -> dict:
+    """
+    synthesize_speech for a whole reply, synthesizing its sentences in parallel.
+    
+    Args:
+        text: Reply to speak
+        speak: TTS function for one sentence (e.g. a cached synthesize_speech)
+    
+    Returns:
+        Same shape as synthesize_speech - one MP3 for the whole text
+    """
+    sentences = split_sentences(text)
+    if len(sentences) <= 1:
+        return await speak(text)
+    
+    results = await asyncio.gather(*(speak(sentence) for sentence in sentences))
+    for result in results:
+        if not result["success"]:
+            return result
+    
+    # Raw clips concatenate directly - no base64 round trip per sentence
+    return {
+        "success": True,
+        "audio": b"".join(result["audio"] for result in results),
+        "format": "mp3",
+    }
+
+
+# Bytes per chunk when relaying streamed audio
+SPEECH_CHUNK_BYTES = 4096
+
+
+async def stream_speech(text: str, voice: str = "nova") -> AsyncIterator[bytes]:
+    """
+    Convert text to speech, yielding MP3 bytes as OpenAI produces them.
+    
+    generate_speech waits for the whole clip before returning anything;
+    relaying the chunks lets playback start after the first few hundred
+    milliseconds of audio instead.
+    """
+    async with async_client.audio.speech.with_streaming_response.create(
+        model="tts-1",
+        voice=voice,
+        input=text,
+        response_format="mp3",
+        speed=1.0,
+    ) as response:
+        async for chunk in response.iter_bytes(SPEECH_CHUNK_BYTES):
+            yield chunk
+
+
 async def voice_chat(
     message: str,
     conversation_history: list[dict] = [],
@@ -153,6 +279,78 @@ async def voice_chat(
         Dictionary with response text
     """
     
+    messages, should_use_rag = await _voice_chat_messages(
+        message, conversation_history, detected_ingredients, current_recipe
+    )
+    
+    try:
+        response = await async_client.chat.completions.create(
+            model="gpt-4o-mini",
+            messages=messages,
+            temperature=0.8,  # More personality for voice
+            max_tokens=200,   # Keep responses concise for voice
+        )
+        
+        return {
+            "success": True,
+            "response": response.choices[0].message.content,
+            "used_rag": should_use_rag,
+            "usage": {
+                "prompt_tokens": response.usage.prompt_tokens,
+                "completion_tokens": response.usage.completion_tokens,
+            }
+        }
+        
+    except Exception as e:
+        return {
+            "success": False,
+            "error": str(e)
+        }
+
+
+RECIPE_KEYWORDS = ("recipe", "make", "cook", "suggest", "what can i", "dinner", "lunch", "breakfast", "meal")
+
+# One pass over the message instead of one substring scan per keyword
+# (no word boundaries: "cooking" and "homemade" still count, as before)
+_RECIPE_KEYWORD = re.compile("|".join(map(re.escape, RECIPE_KEYWORDS)), re.IGNORECASE)
+
+# Replies that never need a recipe search, however many ingredients we know about
+FILLER_WORDS = frozenset({
+    "next", "step", "yes", "yeah", "yep", "no", "nope", "ok", "okay", "ready",
+    "done", "repeat", "again", "thanks", "thank", "you", "please", "go", "back",
+    "sure", "great", "cool", "got", "it", "wait", "stop", "and", "the", "that",
+})
+
+_WORD = re.compile(r"[a-z']+")
+
+
+def _wants_recipe_search(message: str, detected_ingredients: list[str] | None) -> bool:
+    """
+    Decide whether this turn is worth a recipe search (embedding + lookup).
+    
+    Explicit recipe talk always searches. Otherwise known ingredients are
+    enough - unless the message is just conversational filler ("yes",
+    "next step", "thanks") or too short to be a real question.
+    """
+    if _RECIPE_KEYWORD.search(message):
+        return True
+    if not detected_ingredients:
+        return False
+    
+    words = _WORD.findall(message.lower())
+    if len(words) < 4 or all(word in FILLER_WORDS for word in words):
+        return False
+    return True
+
+
+async def _voice_chat_messages(
+    message: str,
+    conversation_history: list[dict],
+    detected_ingredients: list[str],
+    current_recipe: dict | None,
+) -> tuple[list[dict], bool]:
+    """Build the chat messages for a voice turn (runs the RAG lookup if useful)."""
+    
     # Build context message if we have ingredients
     context_parts = []
     
@@ -166,15 +364,16 @@ async def voice_chat(
     
     # Use RAG to find relevant recipes based on the message and ingredients
     rag_context = ""
-    recipe_keywords = ["recipe", "make", "cook", "suggest", "what can i", "dinner", "lunch", "breakfast", "meal"]
-    should_use_rag = any(keyword in message.lower() for keyword in recipe_keywords) or detected_ingredients
-    
+    should_use_rag = _wants_recipe_search(message, detected_ingredients)
     if should_use_rag:
         search_query = message
         if detected_ingredients:
             search_query += f" with {', '.join(detected_ingredients[:5])}"  # Limit to first 5
         
-        retrieved = rag_service.semantic_search(
+        # The search embeds the query and scans the index - blocking work
+        # that runs in a thread so other requests keep being served meanwhile
+        retrieved = await asyncio.to_thread(
+            rag_service.cached_semantic_search,
             query=search_query,
             n_results=3
         )
@@ -198,36 +397,13 @@ async def voice_chat(
             "content": f"Context for this conversation:\n{context_message}"
         })
     
-    # Add conversation history (keep last 10 messages)
-    for msg in conversation_history[-10:]:
-        messages.append(msg)
+    # Add as much recent conversation history as fits the token budget
+    messages.extend(trim_history(conversation_history))
     
     # Add current message
     messages.append({"role": "user", "content": message})
     
-    try:
-        response = client.chat.completions.create(
-            model="gpt-4o-mini",
-            messages=messages,
-            temperature=0.8,  # More personality for voice
-            max_tokens=200,   # Keep responses concise for voice
-        )
-        
-        return {
-            "success": True,
-            "response": response.choices[0].message.content,
-            "used_rag": should_use_rag,
-            "usage": {
-                "prompt_tokens": response.usage.prompt_tokens,
-                "completion_tokens": response.usage.completion_tokens,
-            }
-        }
-        
-    except Exception as e:
-        return {
-            "success": False,
-            "error": str(e)
-        }
+    return messages, should_use_rag
 
 
 async def analyze_ingredients_and_greet(ingredients: list[str]) -> dict:
@@ -242,23 +418,10 @@ async def analyze_ingredients_and_greet(ingredients: list[str]) -> dict:
         Dictionary with greeting response
     """
     
-    prompt = f"""The user has these ingredients available: {', '.join(ingredients)}
-
-Generate a warm, enthusiastic greeting that:
-1. Acknowledges 2-3 specific ingredients they have
-2. Expresses excitement about the possibilities
-3. Asks ONE question about their preference (cuisine, time, mood, etc.)
-
-Keep it to 2-3 sentences maximum. Speak naturally like you're in the kitchen with them.
-"""
-    
     try:
-        response = client.chat.completions.create(
+        response = await async_client.chat.completions.create(
             model="gpt-4o-mini",
-            messages=[
-                {"role": "system", "content": VOICE_CHEF_SYSTEM_PROMPT},
-                {"role": "user", "content": prompt}
-            ],
+            messages=_greeting_messages(ingredients),
             temperature=0.8,
             max_tokens=150,
         )
@@ -275,6 +438,24 @@ Keep it to 2-3 sentences maximum. Speak naturally like you're in the kitchen wit
         }
 
 
+def _greeting_messages(ingredients: list[str]) -> list[dict]:
+    """Build the chat messages for an ingredients greeting."""
+    prompt = f"""The user has these ingredients available: {', '.join(ingredients)}
+
+Generate a warm, enthusiastic greeting that:
+1. Acknowledges 2-3 specific ingredients they have
+2. Expresses excitement about the possibilities
+3. Asks ONE question about their preference (cuisine, time, mood, etc.)
+
+Keep it to 2-3 sentences maximum. Speak naturally like you're in the kitchen with them.
+"""
+    
+    return [
+        {"role": "system", "content": VOICE_CHEF_SYSTEM_PROMPT},
+        {"role": "user", "content": prompt}
+    ]
+
+
 async def get_recipe_suggestion_voice(
     ingredients: list[str],
     cuisine_preference: str | None = None,
@@ -288,6 +469,40 @@ async def get_recipe_suggestion_voice(
     generates a natural-sounding suggestion that can be read aloud.
     """
     
+    messages, retrieved_count = await _recipe_suggestion_messages(
+        ingredients, cuisine_preference, dietary_restrictions, time_constraint
+    )
+    
+    try:
+        response = await async_client.chat.completions.create(
+            model="gpt-4o-mini",
+            messages=messages,
+            temperature=0.8,
+            max_tokens=200,
+        )
+        
+        return {
+            "success": True,
+            "response": response.choices[0].message.content,
+            "retrieved_recipes": retrieved_count,
+            "used_rag": True,
+        }
+        
+    except Exception as e:
+        return {
+            "success": False,
+            "error": str(e)
+        }
+
+
+async def _recipe_suggestion_messages(
+    ingredients: list[str],
+    cuisine_preference: str | None,
+    dietary_restrictions: list[str],
+    time_constraint: str | None,
+) -> tuple[list[dict], int]:
+    """Retrieve matching recipes (RAG) and build the spoken-suggestion messages."""
+    
     # Step 1: Build search query for RAG
     search_query = f"recipe using {', '.join(ingredients)}"
     if cuisine_preference:
@@ -298,7 +513,8 @@ async def get_recipe_suggestion_voice(
         search_query += f" {time_constraint}"
     
     # Step 2: Retrieve relevant recipes from database using RAG
-    retrieved_recipes = rag_service.semantic_search(
+    retrieved_recipes = await asyncio.to_thread(
+        rag_service.cached_semantic_search,
         query=search_query,
         n_results=3,
         cuisine_filter=cuisine_preference,
@@ -342,29 +558,11 @@ IMPORTANT: Only suggest recipes from the database above. Don't make up recipes!
 Keep it to 3-4 sentences. Be conversational and excited!
 """
     
-    try:
-        response = client.chat.completions.create(
-            model="gpt-4o-mini",
-            messages=[
-                {"role": "system", "content": VOICE_CHEF_SYSTEM_PROMPT},
-                {"role": "user", "content": prompt}
-            ],
-            temperature=0.8,
-            max_tokens=200,
-        )
-        
-        return {
-            "success": True,
-            "response": response.choices[0].message.content,
-            "retrieved_recipes": len(retrieved_recipes),
-            "used_rag": True,
-        }
-        
-    except Exception as e:
-        return {
-            "success": False,
-            "error": str(e)
-        }
+    messages = [
+        {"role": "system", "content": VOICE_CHEF_SYSTEM_PROMPT},
+        {"role": "user", "content": prompt}
+    ]
+    return messages, len(retrieved_recipes)
 
 
 async def get_cooking_step_guidance(
@@ -385,23 +583,12 @@ async def get_cooking_step_guidance(
         user_question: Optional question the user asked about this step
     """
     
-    prompt = f"""Recipe: {recipe_name}
-Step {current_step} of {total_steps}: {step_instruction}
-
-{"User asked: " + user_question if user_question else "Guide them through this step."}
-
-Give clear, concise voice instructions for this step. If they asked a question, answer it.
-End by asking if they're ready for the next step or need more details.
-Keep it to 2-3 sentences.
-"""
-    
     try:
-        response = client.chat.completions.create(
+        response = await async_client.chat.completions.create(
             model="gpt-4o-mini",
-            messages=[
-                {"role": "system", "content": VOICE_CHEF_SYSTEM_PROMPT},
-                {"role": "user", "content": prompt}
-            ],
+            messages=_cooking_step_messages(
+                recipe_name, current_step, total_steps, step_instruction, user_question
+            ),
             temperature=0.7,
             max_tokens=150,
         )
@@ -419,3 +606,236 @@ Keep it to 2-3 sentences.
             "error": str(e)
         }
 
+
+def _cooking_step_messages(
+    recipe_name: str,
+    current_step: int,
+    total_steps: int,
+    step_instruction: str,
+    user_question: str | None,
+) -> list[dict]:
+    """Build the chat messages for spoken step guidance."""
+    prompt = f"""Recipe: {recipe_name}
+Step {current_step} of {total_steps}: {step_instruction}
+
+{"User asked: " + user_question if user_question else "Guide them through this step."}
+
+Give clear, concise voice instructions for this step. If they asked a question, answer it.
+End by asking if they're ready for the next step or need more details.
+Keep it to 2-3 sentences.
+"""
+    
+    return [
+        {"role": "system", "content": VOICE_CHEF_SYSTEM_PROMPT},
+        {"role": "user", "content": prompt}
+    ]
+
+
+# =============================================================================
+# Streaming Voice Replies
+# =============================================================================
+# Same prompts as above, but the reply text is yielded as it is generated.
+
+async def _stream_reply(messages: list[dict], temperature: float, max_tokens: int) -> AsyncIterator[str]:
+    """Yield the text deltas of a streamed chat completion."""
+    stream = await async_client.chat.completions.create(
+        model="gpt-4o-mini",
+        messages=messages,
+        temperature=temperature,
+        max_tokens=max_tokens,
+        stream=True,
+    )
+    async for chunk in stream:
+        if chunk.choices and chunk.choices[0].delta.content:
+            yield chunk.choices[0].delta.content
+
+
+async def voice_chat_stream(
+    message: str,
+    conversation_history: list[dict] = [],
+    detected_ingredients: list[str] = [],
+    current_recipe: dict | None = None,
+) -> AsyncIterator[str]:
+    """Streaming version of voice_chat."""
+    messages, _ = await _voice_chat_messages(
+        message, conversation_history, detected_ingredients, current_recipe
+    )
+    async for text in _stream_reply(messages, temperature=0.8, max_tokens=200):
+        yield text
+
+
+def analyze_ingredients_and_greet_stream(ingredients: list[str]) -> AsyncIterator[str]:
+    """Streaming version of analyze_ingredients_and_greet."""
+    return _stream_reply(_greeting_messages(ingredients), temperature=0.8, max_tokens=150)
+
+
+async def get_recipe_suggestion_voice_stream(
+    ingredients: list[str],
+    cuisine_preference: str | None = None,
+    dietary_restrictions: list[str] = [],
+    time_constraint: str | None = None,
+) -> AsyncIterator[str]:
+    """Streaming version of get_recipe_suggestion_voice."""
+    messages, _ = await _recipe_suggestion_messages(
+        ingredients, cuisine_preference, dietary_restrictions, time_constraint
+    )
+    async for text in _stream_reply(messages, temperature=0.8, max_tokens=200):
+        yield text
+
+
+def get_cooking_step_guidance_stream(
+    recipe_name: str,
+    current_step: int,
+    total_steps: int,
+    step_instruction: str,
+    user_question: str | None = None,
+) -> AsyncIterator[str]:
+    """Streaming version of get_cooking_step_guidance."""
+    return _stream_reply(
+        _cooking_step_messages(
+            recipe_name, current_step, total_steps, step_instruction, user_question
+        ),
+        temperature=0.7,
+        max_tokens=150,
+    )
+
+
+# A sentence ends at . ! or ? followed by whitespace, or at a line break
+# (so "1.5 cups" isn't split in two)
+SENTENCE_END = re.compile(r"[.!?]+(?=\s)|\n")
+SENTENCE_END_CHARS = frozenset(".!?\n")
+
+# Flush to TTS anyway if this much text builds up without a sentence end
+MAX_PENDING_CHARS = 8192
+
+
+class LazyTextBuffer:
+    """
+    Collects streamed text and hands it out a sentence at a time.
+    
+    CONCEPT: Avoiding Quadratic String Building
+    `text += chunk` copies everything received so far on every chunk -
+    O(n^2) work over a long reply. We keep the chunks in a list and only
+    join them when a sentence is actually needed.
+    """
+    
+    def __init__(self, max_pending: int = MAX_PENDING_CHARS):
+        self.max_pending = max_pending
+        self._chunks: list[str] = []
+        self._length = 0
+        self._may_end = False  # Seen a possible sentence end since the last join
+    
+    def __len__(self) -> int:
+        return self._length
+    
+    def append(self, chunk: str) -> None:
+        """Add a streamed chunk of text."""
+        self._chunks.append(chunk)
+        self._length += len(chunk)
+        self._may_end = self._may_end or not SENTENCE_END_CHARS.isdisjoint(chunk)
+    
+    def _text(self) -> str:
+        """Join the chunks (once) and keep the result as a single chunk."""
+        if len(self._chunks) > 1:
+            self._chunks = ["".join(self._chunks)]
+        return self._chunks[0] if self._chunks else ""
+    
+    def _sentence_end(self) -> int:
+        """Index just past the last complete sentence (0 if none)."""
+        if not self._may_end and self._length < self.max_pending:
+            return 0
+        
+        text = self._text()
+        ends = [match.end() for match in SENTENCE_END.finditer(text)]
+        if ends:
+            return ends[-1]
+        
+        # A trailing "." may still become a sentence end when whitespace follows
+        self._may_end = text[-1:] in SENTENCE_END_CHARS
+        # Nothing to break on, but too much text is waiting - speak it anyway
+        return self._length if self._length >= self.max_pending else 0
+    
+    def peek_sentence(self) -> str | None:
+        """Return the complete sentence(s) ready to speak, without removing them."""
+        end = self._sentence_end()
+        return self._text()[:end] if end else None
+    
+    def flush(self, complete_only: bool = False) -> str:
+        """
+        Remove and return buffered text.
+        
+        Args:
+            complete_only: Only take complete sentences, keeping a partial
+                           sentence buffered for more chunks
+        """
+        end = self._sentence_end() if complete_only else self._length
+        text = self._text()
+        taken, rest = text[:end], text[end:]
+        
+        self._chunks = [rest] if rest else []
+        self._length = len(rest)
+        self._may_end = rest[-1:] in SENTENCE_END_CHARS
+        return taken
+
+
+async def speak_while_generating(
+    tokens: AsyncIterator[str],
+    speak: Callable[[str], Awaitable[dict]] | None = generate_speech,
+) -> AsyncIterator[dict]:
+    """
+    Turn a stream of reply tokens into spoken sentences.
+    
+    A reader task collects tokens and starts TTS for each sentence as soon
+    as it is complete; sentences are handed over through an asyncio.Queue
+    and yielded in order as their audio becomes ready.
+    
+    Args:
+        tokens: Streamed reply text (e.g. from voice_chat_stream)
+        speak: TTS function (text -> generate_speech-style result),
+               or None for text only
+    
+    Yields:
+        {"text_chunk": sentence, "audio_chunk_b64": base64 MP3 or None}
+    """
+    queue: asyncio.Queue = asyncio.Queue()
+    
+    def start_speaking(text: str) -> None:
+        speech = asyncio.create_task(speak(text.strip())) if speak and text.strip() else None
+        queue.put_nowait((text, speech))
+    
+    async def read_tokens() -> None:
+        try:
+            buffer = LazyTextBuffer()
+            async for token in tokens:
+                buffer.append(token)
+                if buffer.peek_sentence():
+                    start_speaking(buffer.flush(complete_only=True))
+            
+            if buffer:
+                start_speaking(buffer.flush())
+            queue.put_nowait(None)
+        except Exception as e:
+            queue.put_nowait(e)
+    
+    reader = asyncio.create_task(read_tokens())
+    try:
+        while True:
+            item = await queue.get()
+            if item is None:
+                break
+            if isinstance(item, Exception):
+                raise item
+            
+            text, speech = item
+            audio_base64 = None
+            if speech is not None:
+                result = await speech
+                audio_base64 = result.get("audio_base64") if result.get("success") else None
+            yield {"text_chunk": text, "audio_chunk_b64": audio_base64}
+    finally:
+        # Client went away (or an error) - stop generating and speaking
+        reader.cancel()
+        while not queue.empty():
+            item = queue.get_nowait()
+            if isinstance(item, tuple) and item[1] is not None:
+                item[1].cancel()
@@ -409,6 +409,7 @@ function VoiceAssistant({ recipes }) {
   
   // Audio refs
   const audioRef = useRef(null)
+  const audioQueueRef = useRef([])
   const mediaRecorderRef = useRef(null)
   const audioChunksRef = useRef([])
   
@@ -494,24 +495,10 @@ function VoiceAssistant({ recipes }) {
   const greetWithIngredients = async (ingredientList) => {
     setIsProcessing(true)
     try {
-      const response = await fetch('/api/voice/greet-ingredients', {
-        method: 'POST',
-        headers: { 'Content-Type': 'application/json' },
-        body: JSON.stringify({
-          ingredients: ingredientList,
-          generate_audio: voiceEnabled,
-        }),
+      await streamVoiceReply('/api/voice/greet-ingredients/stream', {
+        ingredients: ingredientList,
+        generate_audio: voiceEnabled,
       })
-
-      if (response.ok) {
-        const data = await response.json()
-      if (data.success) {
-          addToConversation('assistant', data.text_response)
-          if (data.audio_base64 && voiceEnabled) {
-            playAudio(data.audio_base64)
-          }
-        }
-      }
     } catch (err) {
       console.error('Failed to greet:', err)
     } finally {
@@ -537,8 +524,73 @@ function VoiceAssistant({ recipes }) {
     audioRef.current.play()
   }
 
+  // Play streamed sentences back to back, in the order they arrive
+  const enqueueAudio = (base64Audio) => {
+    audioQueueRef.current.push(base64Audio)
+    if (!audioRef.current || audioRef.current.paused || audioRef.current.ended) {
+      playNextQueued()
+    }
+  }
+
+  const playNextQueued = () => {
+    const next = audioQueueRef.current.shift()
+    if (!next) {
+      setIsSpeaking(false)
+      return
+    }
+    playAudio(next)
+    audioRef.current.onended = playNextQueued
+  }
+
+  // Streamed voice replies: each sentence's audio starts playing as soon as
+  // it is ready instead of after the whole reply (NDJSON frames from the server)
+  const streamVoiceChat = (message) => streamVoiceReply('/api/voice/chat/stream', {
+    message,
+    conversation_history: conversation.map(m => ({
+      role: m.role,
+      content: m.content,
+    })),
+    detected_ingredients: ingredients,
+    generate_audio: voiceEnabled,
+  })
+
+  const streamVoiceReply = async (url, body) => {
+    const response = await fetch(url, {
+      method: 'POST',
+      headers: { 'Content-Type': 'application/json' },
+      body: JSON.stringify(body),
+    })
+
+    if (!response.ok) {
+      throw new Error('Failed to get response')
+    }
+
+    const reader = response.body.getReader()
+    const decoder = new TextDecoder()
+    let buffered = ''
+    while (true) {
+      const { done, value } = await reader.read()
+      if (done) break
+      buffered += decoder.decode(value, { stream: true })
+
+      const lines = buffered.split('\n')
+      buffered = lines.pop()
+      for (const line of lines) {
+        if (!line.trim()) continue
+        const frame = JSON.parse(line)
+        if (frame.done) {
+          if (!frame.success) throw new Error(frame.error)
+          addToConversation('assistant', frame.text_response)
+        } else if (frame.audio_chunk_b64 && voiceEnabled) {
+          enqueueAudio(frame.audio_chunk_b64)
+        }
+      }
+    }
+  }
+
   // Stop audio
   const stopAudio = () => {
+    audioQueueRef.current = []
     if (audioRef.current) {
       audioRef.current.pause()
       audioRef.current.currentTime = 0
@@ -612,31 +664,7 @@ function VoiceAssistant({ recipes }) {
       addToConversation('user', userMessage)
 
       // Get AI response
-      const chatResponse = await fetch('/api/voice/chat', {
-          method: 'POST',
-          headers: { 'Content-Type': 'application/json' },
-          body: JSON.stringify({
-          message: userMessage,
-          conversation_history: conversation.map(m => ({
-            role: m.role,
-            content: m.content,
-          })),
-          detected_ingredients: ingredients,
-          }),
-        })
-
-      if (!chatResponse.ok) {
-        throw new Error('Failed to get response')
-      }
-
-      const chatData = await chatResponse.json()
-      
-      if (chatData.success) {
-        addToConversation('assistant', chatData.text_response)
-        if (chatData.audio_base64 && voiceEnabled) {
-          playAudio(chatData.audio_base64)
-        }
-      }
+      await streamVoiceChat(userMessage)
     } catch (err) {
       setError('Failed to process voice input. Please try again.')
       console.error(err)
@@ -653,28 +681,7 @@ function VoiceAssistant({ recipes }) {
     addToConversation('user', message)
 
     try {
-      const response = await fetch('/api/voice/chat', {
-          method: 'POST',
-          headers: { 'Content-Type': 'application/json' },
-          body: JSON.stringify({
-          message,
-          conversation_history: conversation.map(m => ({
-            role: m.role,
-            content: m.content,
-          })),
-          detected_ingredients: ingredients,
-          }),
-        })
-
-      if (response.ok) {
-        const data = await response.json()
-        if (data.success) {
-          addToConversation('assistant', data.text_response)
-          if (data.audio_base64 && voiceEnabled) {
-            playAudio(data.audio_base64)
-          }
-        }
-      }
+      await streamVoiceChat(message)
     } catch (err) {
       setError('Failed to send message')
       console.error(err)
@@ -50,6 +50,10 @@ export default function LiveCookingCoach({ recipe, onExit }) {
   const [analysisHistory, setAnalysisHistory] = useState([])
   const analysisIntervalRef = useRef(null)
 
+  // One WebSocket per cooking session: context is sent once, frames as raw JPEG bytes
+  const socketRef = useRef(null)
+  const sessionIdRef = useRef(crypto.randomUUID())
+
   // Voice state
   const [voiceEnabled, setVoiceEnabled] = useState(true)
   const [isSpeaking, setIsSpeaking] = useState(false)
@@ -94,6 +98,12 @@ export default function LiveCookingCoach({ recipe, onExit }) {
   const instructions = recipe?.instructions?.split('\n').filter(line => line.trim()) || []
   const currentInstruction = instructions[currentStep]?.replace(/^\d+\.\s*/, '') || ''
 
+  // What we'd say when moving to step `index` (0-based) - used to prefetch its audio
+  const stepPhrase = (index) => {
+    const instruction = instructions[index]?.replace(/^\d+\.\s*/, '')
+    return instruction ? `Step ${index + 1}: ${instruction}` : null
+  }
+
   // ============================================================================
   // Voice Activity Detection (VAD) - Interrupt AI when user speaks
   // ============================================================================
@@ -332,7 +342,7 @@ export default function LiveCookingCoach({ recipe, onExit }) {
       addMessage('assistant', `📸 Camera ready! I can now see your cooking. I'll guide you through ${recipe?.name || 'your dish'}. Just start talking anytime to interrupt me!`)
 
       if (voiceEnabled && currentInstruction) {
-        speakGuidance(`Let's begin! ${currentInstruction}`)
+        speakGuidance(`Let's begin! ${currentInstruction}`, [stepPhrase(currentStep + 1)])
       }
 
     } catch (err) {
@@ -362,8 +372,9 @@ export default function LiveCookingCoach({ recipe, onExit }) {
   // Frame Capture & AI Analysis
   // ============================================================================
 
+  // Returns the current frame as a JPEG Blob (sent as raw bytes - no base64)
   const captureFrame = useCallback(() => {
-    if (!videoRef.current || !canvasRef.current) return null
+    if (!videoRef.current || !canvasRef.current) return Promise.resolve(null)
 
     const video = videoRef.current
     const canvas = canvasRef.current
@@ -373,71 +384,136 @@ export default function LiveCookingCoach({ recipe, onExit }) {
     canvas.height = video.videoHeight
     ctx.drawImage(video, 0, 0)
 
-    return canvas.toDataURL('image/jpeg', 0.7)
+    return new Promise(resolve => canvas.toBlob(resolve, 'image/jpeg', 0.7))
   }, [])
 
-  const analyzeFrame = useCallback(async () => {
-    if (isAnalyzing || !cameraActive) return
+  const handleAnalysis = useCallback((data) => {
+    if (!data.success) return
 
-    const frameData = captureFrame()
-    if (!frameData) return
+    setLastAnalysis(data)
+    setAnalysisHistory(prev => [...prev.slice(-10), data])
 
-    setIsAnalyzing(true)
+    if (data.detected_ingredients) {
+      setCookingContext(prev => ({
+        ...prev,
+        detectedIngredients: data.detected_ingredients,
+      }))
+    }
 
-    try {
-      const response = await fetch('/api/live-cook/analyze', {
-        method: 'POST',
-        headers: { 'Content-Type': 'application/json' },
-        body: JSON.stringify({
-          image_base64: frameData.split(',')[1],
-          recipe_name: recipe?.name || 'Unknown Recipe',
-          current_step: currentStep + 1,
-          current_instruction: currentInstruction,
-          previous_context: cookingContext,
-          detected_ingredients: cookingContext.detectedIngredients,
-        }),
-      })
+    if (data.guidance) {
+      addMessage('assistant', data.guidance)
+      if (voiceEnabled && data.speak && !isListening) {
+        speakGuidance(data.guidance)
+      }
+    }
 
-      if (!response.ok) throw new Error('Analysis failed')
+    if (data.warning) {
+      addMessage('warning', data.warning)
+      if (voiceEnabled && !isListening) {
+        speakGuidance(`Warning: ${data.warning}`)
+      }
+    }
 
-      const data = await response.json()
+    if (data.step_complete_suggestion) {
+      addMessage('assistant', `✅ Looks like you've completed this step! ${data.next_step_preview || 'Ready for the next step?'}`)
+    }
+  }, [voiceEnabled, isListening])
 
-      if (data.success) {
-        setLastAnalysis(data)
-        setAnalysisHistory(prev => [...prev.slice(-10), data])
+  // The socket handler is created once - read the latest handler through a ref
+  const handleAnalysisRef = useRef(handleAnalysis)
+  useEffect(() => {
+    handleAnalysisRef.current = handleAnalysis
+  }, [handleAnalysis])
 
-        if (data.detected_ingredients) {
-          setCookingContext(prev => ({
-            ...prev,
-            detectedIngredients: data.detected_ingredients,
-          }))
-        }
+  const sendContext = useCallback(() => {
+    const socket = socketRef.current
+    if (socket?.readyState !== WebSocket.OPEN) return
 
-        if (data.guidance) {
-          addMessage('assistant', data.guidance)
-          if (voiceEnabled && data.speak && !isListening) {
-            speakGuidance(data.guidance)
-          }
-        }
+    socket.send(JSON.stringify({
+      recipe_name: recipe?.name || 'Unknown Recipe',
+      current_step: currentStep + 1,
+      current_instruction: currentInstruction || '',
+    }))
+  }, [recipe, currentStep, currentInstruction])
 
-        if (data.warning) {
-          addMessage('warning', data.warning)
-          if (voiceEnabled && !isListening) {
-            speakGuidance(`Warning: ${data.warning}`)
-          }
-        }
+  // Open the live-cooking socket while the camera is on
+  useEffect(() => {
+    if (!cameraActive) return
 
-        if (data.step_complete_suggestion) {
-          addMessage('assistant', `✅ Looks like you've completed this step! ${data.next_step_preview || 'Ready for the next step?'}`)
-        }
+    const protocol = window.location.protocol === 'https:' ? 'wss' : 'ws'
+    const socket = new WebSocket(`${protocol}://${window.location.host}/ws/live-cook/${sessionIdRef.current}`)
+    socketRef.current = socket
+
+    socket.onmessage = (event) => {
+      setIsAnalyzing(false)
+      try {
+        handleAnalysisRef.current(JSON.parse(event.data))
+      } catch (err) {
+        console.error('Analysis error:', err)
       }
+    }
+    socket.onclose = () => {
+      if (socketRef.current === socket) socketRef.current = null
+      setIsAnalyzing(false)
+    }
+
+    return () => socket.close()
+  }, [cameraActive])
+
+  // Tell the server whenever the recipe or step changes (and once connected)
+  useEffect(() => {
+    const socket = socketRef.current
+    if (!socket) return
+
+    if (socket.readyState === WebSocket.OPEN) {
+      sendContext()
+    } else {
+      socket.addEventListener('open', sendContext, { once: true })
+      return () => socket.removeEventListener('open', sendContext)
+    }
+  }, [cameraActive, sendContext])
+
+  const analyzeFrame = useCallback(async () => {
+    if (isAnalyzing || !cameraActive) return
+
+    setIsAnalyzing(true)
+
+    let sentOverSocket = false
+    try {
+      const frame = await captureFrame()
+      if (!frame) return
+
+      // Fast path: the session's socket - the reply arrives in onmessage
+      const socket = socketRef.current
+      if (socket?.readyState === WebSocket.OPEN) {
+        socket.send(frame)
+        sentOverSocket = true
+        return
+      }
+
+      const formData = new FormData()
+      formData.append('image', frame, 'frame.jpg')
+      formData.append('recipe_name', recipe?.name || 'Unknown Recipe')
+      formData.append('current_step', String(currentStep + 1))
+      formData.append('current_instruction', currentInstruction || '')
+      formData.append('previous_context', JSON.stringify(cookingContext))
+      formData.append('detected_ingredients', JSON.stringify(cookingContext.detectedIngredients || []))
+
+      const response = await fetch('/api/live-cook/analyze-binary', {
+        method: 'POST',
+        body: formData,
+      })
+
+      if (!response.ok) throw new Error('Analysis failed')
+
+      handleAnalysis(await response.json())
 
     } catch (err) {
       console.error('Analysis error:', err)
     } finally {
-      setIsAnalyzing(false)
+      if (!sentOverSocket) setIsAnalyzing(false)
     }
-  }, [isAnalyzing, cameraActive, captureFrame, recipe, currentStep, currentInstruction, cookingContext, voiceEnabled, isListening])
+  }, [isAnalyzing, cameraActive, captureFrame, recipe, currentStep, currentInstruction, cookingContext, handleAnalysis])
 
   useEffect(() => {
     if (cameraActive && autoAnalyze) {
@@ -457,28 +533,17 @@ export default function LiveCookingCoach({ recipe, onExit }) {
   // Voice Functions
   // ============================================================================
 
-  const speakGuidance = async (text) => {
+  // `prefetch`: phrases we'll likely say next - the server prepares their audio in the background.
+  // The audio element streams the MP3, so playback starts with the first chunk.
+  const speakGuidance = (text, prefetch = []) => {
     if (!voiceEnabled || isListening) return
 
-    try {
-      const response = await fetch('/api/voice/speak', {
-        method: 'POST',
-        headers: { 'Content-Type': 'application/json' },
-        body: JSON.stringify({ text, voice: 'nova' }),
-      })
-
-      if (response.ok) {
-        const data = await response.json()
-        if (data.audio_base64) {
-          playAudio(data.audio_base64)
-        }
-      }
-    } catch (err) {
-      console.error('Speech error:', err)
-    }
+    const params = new URLSearchParams({ text, voice: 'nova' })
+    prefetch.filter(Boolean).forEach((phrase) => params.append('prefetch', phrase))
+    playAudioUrl(`/api/voice/speak/stream?${params}`)
   }
 
-  const playAudio = (base64Audio) => {
+  const playAudioUrl = (url) => {
     // Don't play if user is speaking
     if (isListening) return
 
@@ -486,7 +551,7 @@ export default function LiveCookingCoach({ recipe, onExit }) {
       audioRef.current = new Audio()
     }
     
-    audioRef.current.src = `data:audio/mp3;base64,${base64Audio}`
+    audioRef.current.src = url
     audioRef.current.onplay = () => setIsSpeaking(true)
     audioRef.current.onended = () => setIsSpeaking(false)
     audioRef.current.onerror = () => setIsSpeaking(false)
@@ -631,7 +696,7 @@ export default function LiveCookingCoach({ recipe, onExit }) {
       setCurrentStep(prev => prev + 1)
       const nextInstruction = instructions[currentStep + 1]?.replace(/^\d+\.\s*/, '')
       if (voiceEnabled && nextInstruction) {
-        speakGuidance(`Step ${currentStep + 2}: ${nextInstruction}`)
+        speakGuidance(`Step ${currentStep + 2}: ${nextInstruction}`, [stepPhrase(currentStep + 2)])
       }
       addMessage('assistant', `📍 Step ${currentStep + 2}: ${nextInstruction}`)
     }
@@ -21,6 +21,11 @@ export default defineConfig({
       '/api': {
         target: 'http://localhost:8000',
         changeOrigin: true,
+      },
+      // Live-cooking WebSocket
+      '/ws': {
+        target: 'ws://localhost:8000',
+        ws: true,
       }
     }
   }